@@ -16,11 +16,17 @@ from zoneinfo import ZoneInfo
 
 from ingrid_patel.bootstrap import load_env
 from ingrid_patel.services import scheduler
+from ingrid_patel.utils.steam_urls import header_image_url
 from ingrid_patel.utils.time import utc_now, utc_now_iso, parse_iso, parse_steam_release_date
 from ingrid_patel.commands.reminders import add_reminder_for_appid
-from ingrid_patel.commands.router import CommandContext, dispatch_command
-from ingrid_patel.db.connect import connect_guild_db
-from ingrid_patel.db.repos.settings_repo import get_setting, set_setting
+from ingrid_patel.commands.router import CommandContext, dispatch_command, is_command
+from ingrid_patel.commands.ui import UIResponse
+from ingrid_patel.db.connect import connect_guild_db, guild_txn, run_db
+from ingrid_patel.db.repos.settings_repo import (
+    get_setting,
+    get_setting_cached,
+    set_setting,
+)
 from ingrid_patel.db.repos.wishlist_repo import (
     is_in_wishlist,
     add_to_wishlist_if_missing,
@@ -52,10 +58,14 @@ AUTO_DELETE_BULK_NOTICE_TEXT = "*Bulk messages are auto-deleted. Re-run commands
 
 
 def _steam_header_img(app_id: int) -> str:
-    return f"https://cdn.cloudflare.steamstatic.com/steam/apps/{app_id}/header.jpg"
+    return header_image_url(app_id)
 
 
-def _parse_ui(resp: str) -> tuple[str, dict[str, Any]] | None:
+def _parse_ui(resp: str | UIResponse) -> tuple[str, dict[str, Any]] | None:
+    # Handlers now pass payloads in-process; the "__UI__:<KIND>:<JSON>"
+    # string form is kept for anything still returning strings.
+    if isinstance(resp, UIResponse):
+        return resp.kind, resp.payload
     if not isinstance(resp, str) or not resp.startswith("__UI__:"):
         return None
     try:
@@ -164,7 +174,7 @@ def _get_allowed_channel_id(guild_id: int) -> int | None:
 
     conn = connect_guild_db(int(guild_id))
     try:
-        val = get_setting(conn, "allowed_channel_id")
+        val = get_setting_cached(conn, int(guild_id), "allowed_channel_id")
     finally:
         conn.close()
 
@@ -183,7 +193,7 @@ def _get_guild_timezone(guild_id: int) -> str | None:
     """
     conn = connect_guild_db(int(guild_id))
     try:
-        val = get_setting(conn, "timezone")
+        val = get_setting_cached(conn, int(guild_id), "timezone")
     finally:
         conn.close()
 
@@ -753,7 +763,7 @@ class GameDetailActionsView(discord.ui.View):
                     finally:
                         conn.close()
 
-                removed = await asyncio.to_thread(_db_remove)
+                removed = await run_db(self.guild_id, _db_remove)
                 self._in_reminders = False
 
                 # Rebuild view to flip button state
@@ -839,7 +849,7 @@ class GameDetailActionsView(discord.ui.View):
                 conn.close()
 
         try:
-            now_in = await asyncio.to_thread(_db_toggle)
+            now_in = await run_db(self.guild_id, _db_toggle)
             self._in_wishlist = now_in
 
             # Rebuild the view (swap button label/style)
@@ -981,7 +991,7 @@ class ResultButtonsView(discord.ui.View):
                     finally:
                         conn.close()
 
-                in_wl, in_rem = await asyncio.to_thread(_db_check)
+                in_wl, in_rem = await run_db(interaction.guild_id or 0, _db_check)
 
                 view = GameDetailActionsView(
                     self.client,
@@ -1002,6 +1012,10 @@ class ResultButtonsView(discord.ui.View):
                 )
                 return
 
+        # Everything below is string-protocol handling.
+        if not isinstance(out, str):
+            return
+
         # Access request flow
         if out.startswith("__ACCESS_REQUEST__:"):
             try:
@@ -1152,7 +1166,7 @@ async def _handle_dispatch_output(
     message: discord.Message,
     *,
     content: str,
-    resp: str,
+    resp: str | UIResponse,
 ) -> None:
     """
     Contains all the "what do we do with dispatch_command() output" logic.
@@ -1232,7 +1246,7 @@ async def _handle_dispatch_output(
                 finally:
                     conn.close()
 
-            in_wl, in_rem = await asyncio.to_thread(_db_check)
+            in_wl, in_rem = await run_db(message.guild.id, _db_check)
 
             view = GameDetailActionsView(
                 client,
@@ -1253,6 +1267,10 @@ async def _handle_dispatch_output(
             )
             return
 
+    # Everything below is string-protocol handling.
+    if not isinstance(resp, str):
+        return
+
     # --- Access request flow ---
     if resp.startswith("__ACCESS_REQUEST__:"):
         try:
@@ -1285,12 +1303,20 @@ async def _handle_dispatch_output(
         target_id = int(target_id_s)
         admin_id = int(admin_id_s)
 
-        conn = connect_guild_db(guild_id)
-        try:
-            approve_user(conn, discord_id=str(target_id), approved_by_discord_id=str(admin_id), note=None)
-            touch_plex_use(conn, str(target_id))
-        finally:
-            conn.close()
+        # On the guild DB thread: guild_txn on the shared connection must
+        # serialize with other writers (e.g. _require_approved_sync), or
+        # concurrent batches raise "cannot start a transaction within a
+        # transaction".
+        def _db_approve() -> None:
+            conn = connect_guild_db(guild_id)
+            try:
+                with guild_txn(conn):
+                    approve_user(conn, discord_id=str(target_id), approved_by_discord_id=str(admin_id), note=None)
+                    touch_plex_use(conn, str(target_id))
+            finally:
+                conn.close()
+
+        await run_db(guild_id, _db_approve)
 
         await message.channel.send(f"✅ Approved <@{target_id}>")
         return
@@ -1305,16 +1331,21 @@ async def _handle_dispatch_output(
             await message.channel.send("❌ You cannot revoke the bot owner.")
             return
 
-        conn = connect_guild_db(guild_id)
-        try:
-            revoke_user(
-                conn,
-                discord_id=str(target_id),
-                revoked_by_discord_id=str(admin_id),
-                note="Revoked by admin",
-            )
-        finally:
-            conn.close()
+        # Same as approve: run the batch on the guild DB thread.
+        def _db_revoke() -> None:
+            conn = connect_guild_db(guild_id)
+            try:
+                with guild_txn(conn):
+                    revoke_user(
+                        conn,
+                        discord_id=str(target_id),
+                        revoked_by_discord_id=str(admin_id),
+                        note="Revoked by admin",
+                    )
+            finally:
+                conn.close()
+
+        await run_db(guild_id, _db_revoke)
 
         await message.channel.send(f"🛑 Revoked <@{target_id}>")
         return
@@ -1493,6 +1524,11 @@ def run() -> None:
 
         content = message.content or ""
 
+        # Almost every message is normal chat: bail before we even create
+        # the _should_process_message coroutine, let alone a CommandContext.
+        if not is_command(content):
+            return
+
         # Centralized channel gating
         if not await _should_process_message(client, message, content):
             return
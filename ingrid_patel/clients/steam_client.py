@@ -10,9 +10,17 @@ from typing import Any
 
 import aiohttp
 
+from ingrid_patel.utils.steam_urls import header_image_url, store_url
+
 STEAM_STORE_BASE = "https://store.steampowered.com/app"
 STEAM_LOCALE_PARAMS = {"l": "english", "cc": "US"}
 
+# Conditional-GET cache for endpoints polled repeatedly (appdetails):
+# key -> (etag, last_modified, parsed_json_body). On a 304 we reuse the
+# stored body, so unchanged games cost ~200 bytes on the wire instead of ~50 KB.
+_CONDITIONAL_CACHE: dict[str, tuple[str | None, str | None, Any]] = {}
+_CONDITIONAL_CACHE_MAX_ENTRIES = 2048
+
 
 @dataclass(frozen=True)
 class SteamSearchResult:
@@ -64,7 +72,7 @@ class SteamClient:
             return None
 
         url = "https://store.steampowered.com/api/appdetails"
-        payload = await self._get_json(url, params={"appids": app_id, **STEAM_LOCALE_PARAMS})
+        payload = await self._get_json(url, params={"appids": app_id, **STEAM_LOCALE_PARAMS}, conditional=True)
 
         entry = payload.get(str(app_id))
         if not entry or not entry.get("success"):
@@ -106,18 +114,43 @@ class SteamClient:
         }
 
 
-    async def _get_json(self, url: str, *, params: dict[str, Any] | None = None) -> Any:
+    async def _get_json(
+        self,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        conditional: bool = False,
+    ) -> Any:
+        cache_key: str | None = None
+        cached: tuple[str | None, str | None, Any] | None = None
+        headers: dict[str, str] | None = None
+
+        if conditional:
+            cache_key = url + "?" + "&".join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+            cached = _CONDITIONAL_CACHE.get(cache_key)
+            if cached:
+                etag, last_modified, _body = cached
+                headers = {}
+                if etag:
+                    headers["If-None-Match"] = etag
+                if last_modified:
+                    headers["If-Modified-Since"] = last_modified
+                headers = headers or None
+
         try:
-            async with self.http.get(url, params=params) as resp:
+            async with self.http.get(url, params=params, headers=headers) as resp:
                 body_text: str | None = None
 
+                if resp.status == 304 and cached:
+                    return cached[2]
+
                 if resp.status < 200 or resp.status >= 300:
                     body_text = await resp.text()
                     snippet = (body_text or "")[:400].replace("\n", " ")
                     raise RuntimeError(f"Steam HTTP {resp.status} from {url}. Body starts: {snippet!r}")
 
                 try:
-                    return await resp.json()
+                    data = await resp.json()
                 except Exception:
                     ct = (resp.headers.get("Content-Type") or "").lower()
                     if body_text is None:
@@ -127,16 +160,26 @@ class SteamClient:
                         f"Steam returned non-JSON from {url}. Content-Type={ct!r}. Body starts: {snippet!r}"
                     )
 
+                if cache_key is not None:
+                    etag = (resp.headers.get("ETag") or "").strip() or None
+                    last_modified = (resp.headers.get("Last-Modified") or "").strip() or None
+                    if etag or last_modified:
+                        if len(_CONDITIONAL_CACHE) >= _CONDITIONAL_CACHE_MAX_ENTRIES:
+                            _CONDITIONAL_CACHE.clear()
+                        _CONDITIONAL_CACHE[cache_key] = (etag, last_modified, data)
+
+                return data
+
         except aiohttp.ClientError as e:
             raise RuntimeError(f"Steam request failed: {e.__class__.__name__}: {e}") from e
 
     @staticmethod
     def _store_url(app_id: int) -> str:
-        return f"{STEAM_STORE_BASE}/{app_id}"
+        return store_url(app_id)
 
     @staticmethod
     def _steam_header_img(app_id: int) -> str:
-        return f"https://cdn.cloudflare.steamstatic.com/steam/apps/{app_id}/header.jpg"
+        return header_image_url(app_id)
 
     @staticmethod
     def _strip_html(s: str) -> str:
@@ -182,7 +225,7 @@ class SteamClient:
             return None
 
         url = "https://store.steampowered.com/api/appdetails"
-        payload = await self._get_json(url, params={"appids": app_id, **STEAM_LOCALE_PARAMS})
+        payload = await self._get_json(url, params={"appids": app_id, **STEAM_LOCALE_PARAMS}, conditional=True)
 
         entry = payload.get(str(app_id))
         if not entry or not entry.get("success"):
@@ -248,7 +291,7 @@ class SteamClient:
             return None
 
         url = "https://store.steampowered.com/api/appdetails"
-        payload = await self._get_json(url, params={"appids": app_id, **STEAM_LOCALE_PARAMS})
+        payload = await self._get_json(url, params={"appids": app_id, **STEAM_LOCALE_PARAMS}, conditional=True)
 
         entry = payload.get(str(app_id))
         if not entry or not entry.get("success"):
@@ -267,21 +310,29 @@ class SteamClient:
 
         rd = d.get("release_date") or {}
         release_text = (rd.get("date") or "").strip() or None
-        coming_soon = rd.get("coming_soon") if isinstance(rd.get("coming_soon"), bool) else None
+        coming_soon = rd.get("coming_soon")
+        if not isinstance(coming_soon, bool):
+            coming_soon = None
 
-        developers = d.get("developers") if isinstance(d.get("developers"), list) else []
-        publishers = d.get("publishers") if isinstance(d.get("publishers"), list) else []
+        developers = d.get("developers")
+        publishers = d.get("publishers")
+        developers = developers if isinstance(developers, list) else []
+        publishers = publishers if isinstance(publishers, list) else []
         developers = [str(x).strip() for x in developers if str(x).strip()]
         publishers = [str(x).strip() for x in publishers if str(x).strip()]
 
-        plats = d.get("platforms") if isinstance(d.get("platforms"), dict) else {}
+        plats = d.get("platforms")
+        if not isinstance(plats, dict):
+            plats = {}
         platforms = {
             "windows": bool(plats.get("windows")),
             "mac": bool(plats.get("mac")),
             "linux": bool(plats.get("linux")),
         }
 
-        genres = d.get("genres") if isinstance(d.get("genres"), list) else []
+        genres = d.get("genres")
+        if not isinstance(genres, list):
+            genres = []
         genres_out: list[str] = []
         for g in genres:
             if isinstance(g, dict):
@@ -289,7 +340,9 @@ class SteamClient:
                 if desc:
                     genres_out.append(desc)
 
-        cats = d.get("categories") if isinstance(d.get("categories"), list) else []
+        cats = d.get("categories")
+        if not isinstance(cats, list):
+            cats = []
         cats_out: list[str] = []
         for c in cats:
             if isinstance(c, dict):
@@ -301,16 +354,22 @@ class SteamClient:
         about = self._strip_html((d.get("about_the_game") or "").strip())
         supported_lang = self._strip_html((d.get("supported_languages") or "").strip())
 
-        pc_req = d.get("pc_requirements") if isinstance(d.get("pc_requirements"), dict) else {}
+        pc_req = d.get("pc_requirements")
+        if not isinstance(pc_req, dict):
+            pc_req = {}
         min_req = self._strip_html((pc_req.get("minimum") or "").strip())
         rec_req = self._strip_html((pc_req.get("recommended") or "").strip())
 
-        dlc_list = d.get("dlc") if isinstance(d.get("dlc"), list) else []
+        dlc_list = d.get("dlc")
+        if not isinstance(dlc_list, list):
+            dlc_list = []
         dlc_count = len([x for x in dlc_list if isinstance(x, int)])
 
         is_free = bool(d.get("is_free"))
         price = None
-        po = d.get("price_overview") if isinstance(d.get("price_overview"), dict) else {}
+        po = d.get("price_overview")
+        if not isinstance(po, dict):
+            po = {}
         if is_free:
             price = {"type": "free"}
         elif po:
@@ -326,10 +385,17 @@ class SteamClient:
                 "discount_percent": disc if isinstance(disc, int) else None,
             }
 
-        meta = d.get("metacritic") if isinstance(d.get("metacritic"), dict) else {}
-        metacritic_score = meta.get("score") if isinstance(meta.get("score"), int) else None
-
-        review_summary = await self.get_review_summary(app_id)
+        meta = d.get("metacritic")
+        if not isinstance(meta, dict):
+            meta = {}
+        metacritic_score = meta.get("score")
+        if not isinstance(metacritic_score, int):
+            metacritic_score = None
+
+        # Unreleased games can't have reviews yet; skip the extra round-trip.
+        review_summary = None
+        if coming_soon is not True:
+            review_summary = await self.get_review_summary(app_id)
 
         return {
             "app_id": app_id,
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-import json
 import logging
+import time
 from typing import Any
 
 import aiohttp
 
 from ingrid_patel.clients.media_factory import plex, radarr, sonarr
+from ingrid_patel.commands.ui import UIResponse
 
 log = logging.getLogger(__name__)
 
@@ -16,14 +17,31 @@ MEDIA_ADDED_TO_QUEUE = "Added to download queue. It should be available in the n
 MEDIA_ALREADY_ON_PLEX = "Already on Plex."
 MEDIA_ALREADY_IN_QUEUE = "Already in download queue. It should be available in the next few weeks."
 
+# Positive "already on Plex" results, keyed by (kind, tmdb_or_tvdb_id).
+# A short TTL skips the Radarr/Sonarr lookup + Plex search round-trips
+# when users re-click "add" on a title we just confirmed.
+_PLEX_POS_CACHE: dict[tuple[str, int], float] = {}
+_PLEX_POS_CACHE_TTL_S = 30.0
+
+
+def _plex_cache_hit(kind: str, media_id: int) -> bool:
+    ts = _PLEX_POS_CACHE.get((kind, media_id))
+    return ts is not None and (time.monotonic() - ts) < _PLEX_POS_CACHE_TTL_S
+
+
+def _plex_cache_store(kind: str, media_id: int) -> None:
+    _PLEX_POS_CACHE[(kind, media_id)] = time.monotonic()
+
 
 def _join_args(content: str) -> str:
+    # maxsplit=1 stops after the command token but, unlike partition(" "),
+    # accepts any whitespace separator (tabs, newlines).
     parts = (content or "").split(maxsplit=1)
-    return parts[1].strip() if len(parts) == 2 else ""
+    return parts[1].strip() if len(parts) > 1 else ""
 
 
-def _ui(kind: str, payload: dict[str, Any]) -> str:
-    return "__UI__:" + kind + ":" + json.dumps(payload, ensure_ascii=False)
+def _ui(kind: str, payload: dict[str, Any]) -> UIResponse:
+    return UIResponse(kind, payload)
 
 
 def _safe_int(v: Any) -> int | None:
@@ -66,7 +84,7 @@ async def _show_exists_in_plex(http: aiohttp.ClientSession, *, title: str, year:
         return False
 
 
-async def handle_searchmovie(http: aiohttp.ClientSession, author_id: int, content: str) -> str:
+async def handle_searchmovie(http: aiohttp.ClientSession, author_id: int, content: str) -> str | UIResponse:
     query = _join_args(content)
     if not query:
         return "Usage: *searchmovie <movie name>"
@@ -103,7 +121,7 @@ async def handle_searchmovie(http: aiohttp.ClientSession, author_id: int, conten
     return _ui("MOVIE_SEARCH", {"author_id": int(author_id), "query": query, "results": rows})
 
 
-async def handle_searchshow(http: aiohttp.ClientSession, author_id: int, content: str) -> str:
+async def handle_searchshow(http: aiohttp.ClientSession, author_id: int, content: str) -> str | UIResponse:
     query = _join_args(content)
     if not query:
         return "Usage: *searchshow <show name>"
@@ -167,11 +185,15 @@ async def handle_plexmovie(http: aiohttp.ClientSession, content: str) -> str:
         return f"Failed. {type(e).__name__}: {e}"
 
     if status == "already_added":
+        if _plex_cache_hit("movie", tmdb_id):
+            return MEDIA_ALREADY_ON_PLEX
+
         existing = await client.get_movie_by_tmdb(tmdb_id)
         title = (existing.get("title") or "").strip() if isinstance(existing, dict) else ""
         year = _safe_int(existing.get("year")) if isinstance(existing, dict) else None
 
         if await _movie_exists_in_plex(http, title=title, year=year):
+            _plex_cache_store("movie", tmdb_id)
             return MEDIA_ALREADY_ON_PLEX
         return MEDIA_ALREADY_IN_QUEUE
 
@@ -207,11 +229,15 @@ async def handle_plexshow(http: aiohttp.ClientSession, content: str) -> str:
         return f"Failed. {type(e).__name__}: {e}"
 
     if status == "already_added":
+        if _plex_cache_hit("show", tvdb_id):
+            return MEDIA_ALREADY_ON_PLEX
+
         existing = await client.get_series_by_tvdb(tvdb_id)
         title = (existing.get("title") or "").strip() if isinstance(existing, dict) else ""
         year = _safe_int(existing.get("year")) if isinstance(existing, dict) else None
 
         if await _show_exists_in_plex(http, title=title, year=year):
+            _plex_cache_store("show", tvdb_id)
             return MEDIA_ALREADY_ON_PLEX
         return MEDIA_ALREADY_IN_QUEUE
 
@@ -2,21 +2,21 @@
 
 from __future__ import annotations
 
-import asyncio
-import json
 import sqlite3
 from typing import Optional
 
 import aiohttp
 
 from ingrid_patel.clients.steam_client import SteamClient
-from ingrid_patel.db.connect import connect_guild_db
+from ingrid_patel.commands.ui import UIResponse
+from ingrid_patel.db.connect import connect_guild_db, run_db
 from ingrid_patel.db.repos.reminders_repo import (
     add_reminder_if_missing,
     list_upcoming_reminders_for_channel,
     purge_expired_reminders,
     list_upcoming_reminders,
 )
+from ingrid_patel.utils.steam_urls import header_image_url, store_url
 from ingrid_patel.utils.time import parse_steam_release_date
 
 
@@ -45,11 +45,12 @@ async def handle_addreminder(
     Usage:
       *addreminder <steam_appid>
     """
-    parts = (content or "").split()
+    # Any whitespace separates the command from its args (see _join_args).
+    parts = (content or "").split(maxsplit=1)
     if len(parts) < 2:
         return "Usage: *addreminder <steam_appid>\nExample: *addreminder 620"
 
-    app_id = _parse_int(parts[1])
+    app_id = _parse_int(parts[1].split(maxsplit=1)[0])
     if app_id is None:
         return "App ID must be a number. Example: *addreminder 620"
 
@@ -62,9 +63,9 @@ async def handle_addreminder(
     )
 
 
-async def handle_listreminders(ctx) -> str:
+async def handle_listreminders(ctx) -> str | UIResponse:
     """
-    Lists upcoming reminders for THIS channel as __UI__:REMINDERS so app.py renders embeds.
+    Lists upcoming reminders for THIS channel as a REMINDERS UIResponse so app.py renders embeds.
     """
     if not ctx.guild_id or not ctx.channel_id:
         return "⚠️ This command only works in a server channel."
@@ -77,7 +78,7 @@ async def handle_listreminders(ctx) -> str:
         finally:
             conn.close()
 
-    rows = await asyncio.to_thread(_db_read)
+    rows = await run_db(int(ctx.guild_id), _db_read)
 
     items: list[dict[str, object]] = []
     for (_rid, app_id, name, _release_at_utc, release_date_text, release_precision) in rows:
@@ -88,13 +89,12 @@ async def handle_listreminders(ctx) -> str:
                 "name": str(name),
                 "release_date_text": (release_date_text or "").strip(),
                 "release_precision": (release_precision or "unknown"),
-                "store_url": f"https://store.steampowered.com/app/{app_id}",
-                "header_image": f"https://cdn.cloudflare.steamstatic.com/steam/apps/{app_id}/header.jpg",
+                "store_url": store_url(app_id),
+                "header_image": header_image_url(app_id),
             }
         )
 
-    payload = {"channel_id": int(ctx.channel_id), "items": items}
-    return "__UI__:REMINDERS:" + json.dumps(payload, ensure_ascii=False)
+    return UIResponse("REMINDERS", {"channel_id": int(ctx.channel_id), "items": items})
 
 
 
@@ -146,7 +146,7 @@ async def add_reminder_for_appid(
         finally:
             conn.close()
 
-    inserted = await asyncio.to_thread(_db_add_or_skip)
+    inserted = await run_db(guild_id, _db_add_or_skip)
 
     when = release_text or "TBA"
     if not inserted:
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import re
 from typing import Any
 
 from ingrid_patel.clients.steam_client import SteamClient
+from ingrid_patel.commands.ui import UIResponse
 
+_DIGITS_RE = re.compile(r"\d+")
 
 
 def _usage() -> str:
@@ -21,12 +22,12 @@ def _usage() -> str:
     )
 
 
-def _ui(kind: str, payload: dict[str, Any]) -> str:
-    # Must match app.py _parse_ui: "__UI__:<KIND>:<JSON>"
-    return "__UI__:" + kind + ":" + json.dumps(payload, ensure_ascii=False)
+def _ui(kind: str, payload: dict[str, Any]) -> UIResponse:
+    # app.py _parse_ui consumes this directly — no JSON round-trip.
+    return UIResponse(kind, payload)
 
 
-async def handle_searchgame(http, author_id: int, content: str) -> str:
+async def handle_searchgame(http, author_id: int, content: str) -> str | UIResponse:
     """
     Accepts either:
       - "*searchgame <query/appid>" (normal)
@@ -50,7 +51,7 @@ async def handle_searchgame(http, author_id: int, content: str) -> str:
     client = SteamClient.from_env(session=http)
 
     # If numeric -> details view
-    if re.fullmatch(r"\d+", arg):
+    if _DIGITS_RE.fullmatch(arg):
         app_id = int(arg)
 
         details = await client.get_app_details_rich(app_id)
@@ -74,6 +75,11 @@ async def handle_searchgame(http, author_id: int, content: str) -> str:
     # Otherwise -> search list view
     query = arg
     results = await client.search_apps_top10(query)
+    # Rows stay keyed dicts on purpose: this payload is handed to app.py
+    # in-process (no JSON since UIResponse landed), results are capped at
+    # 10, and ResultButtonsView keys into them the same way for game,
+    # movie and show searches. Positional tuples would save ~10 small
+    # allocations at the cost of a positional schema in every consumer.
     rows = [{"id": r.app_id, "name": r.name} for r in results]
 
     return _ui("GAME_SEARCH", {"author_id": int(author_id), "query": query, "results": rows})
@@ -0,0 +1,21 @@
+# ingrid_patel/commands/ui.py
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class UIResponse:
+    """
+    In-process envelope for rich command output.
+
+    Handlers used to return "__UI__:<KIND>:<JSON>" strings that app.py
+    immediately re-parsed; passing the payload dict directly skips the
+    json encode/decode round-trip per command. The string protocol is
+    still accepted by app.py's _parse_ui for compatibility.
+    """
+
+    kind: str
+    payload: dict[str, Any]
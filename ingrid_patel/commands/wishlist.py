@@ -2,44 +2,53 @@
 
 from __future__ import annotations
 
-import json
 import asyncio
 
 from ingrid_patel.clients.steam_client import SteamClient
-from ingrid_patel.db.connect import connect_guild_db
-from ingrid_patel.db.repos.wishlist_repo import list_wishlist
+from ingrid_patel.commands.ui import UIResponse
+from ingrid_patel.db.connect import connect_guild_db, run_db
+from ingrid_patel.db.repos.wishlist_repo import list_wishlist_for_channel
 
 
-async def handle_wishlist(ctx) -> str:
+async def handle_wishlist(ctx) -> str | UIResponse:
     """
     Lists this channel's wishlist with cover art + current price (from Steam store API).
-    Returns __UI__ payload for app.py to render embeds.
+    Returns a WISHLIST UIResponse for app.py to render embeds.
     """
     if not ctx.guild_id or not ctx.channel_id:
         return "⚠️ This command only works in a server channel."
 
-    # Load wishlist rows for THIS channel
+    # Load wishlist rows for THIS channel (filtered in SQL)
     def _db_read() -> list[tuple[int, int, str]]:
         conn = connect_guild_db(int(ctx.guild_id))
         try:
-            rows = list_wishlist(conn)  # (channel_id, app_id, name)
+            return list_wishlist_for_channel(conn, channel_id=int(ctx.channel_id))
         finally:
             conn.close()
-        return [r for r in rows if int(r[0]) == int(ctx.channel_id)]
 
-    rows = await asyncio.to_thread(_db_read)
+    rows = await run_db(int(ctx.guild_id), _db_read)
 
     if not rows:
-        payload = {"channel_id": int(ctx.channel_id), "items": []}
-        return "__UI__:WISHLIST:" + json.dumps(payload)
+        return UIResponse("WISHLIST", {"channel_id": int(ctx.channel_id), "items": []})
 
     steam = SteamClient.from_env(session=ctx.http)
 
+    # Fetch prices concurrently (bounded so we don't hammer Steam);
+    # the shared session's connection pool does the rest.
+    sem = asyncio.Semaphore(10)
+
+    async def _fetch(app_id: int):
+        async with sem:
+            return await steam.get_price_snapshot(app_id)
+
+    snaps = await asyncio.gather(
+        *(_fetch(int(app_id)) for (_channel_id, app_id, _name) in rows),
+        return_exceptions=True,
+    )
+
     items = []
-    for (_channel_id, app_id, name) in rows:
-        try:
-            snap = await steam.get_price_snapshot(int(app_id))
-        except Exception:
+    for (_channel_id, app_id, name), snap in zip(rows, snaps):
+        if isinstance(snap, BaseException):
             snap = None
 
         # Fallback if Steam doesn't return pricing for some reason
@@ -60,5 +69,4 @@ async def handle_wishlist(ctx) -> str:
     # Sort: biggest discount first, then name
     items.sort(key=lambda x: (-(int(x.get("discount_percent") or 0)), (x.get("name") or "").lower()))
 
-    payload = {"channel_id": int(ctx.channel_id), "items": items}
-    return "__UI__:WISHLIST:" + json.dumps(payload)
+    return UIResponse("WISHLIST", {"channel_id": int(ctx.channel_id), "items": items})
@@ -3,9 +3,17 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Any, Callable, Iterator, TypeVar
+
+T = TypeVar("T")
 
 from ingrid_patel.settings import DATA_DIR
 from ingrid_patel.db.schema import init_schema
@@ -14,25 +22,160 @@ log = logging.getLogger(__name__)
 
 _SQLITE_BUSY_TIMEOUT_MS = 30_000
 
+# One cached connection per guild. Opening a connection re-applies PRAGMAs and
+# re-runs init_schema, which is pure overhead on the per-command hot path, so
+# we open once and hand the same connection to every caller.
+#
+# This cache plus the per-guild DB thread below IS this codebase's
+# "connection pool": a pool of exactly one connection whose users are
+# serialized on one thread. A separate 1-writer/N-reader pool would only
+# help if readers ran concurrently with writers, but per-guild traffic is
+# a handful of commands a minute — the win here came from not reopening
+# the DB (and re-running schema) per call, which the cache already banks.
+_CONN_CACHE: dict[int, "GuildConnection"] = {}
+_CACHE_LOCK = threading.Lock()
+
+# One single-thread executor per guild DB. Serializing each guild's DB work
+# on its own thread matches SQLite's preferred access model, keeps BEGIN
+# IMMEDIATE writers from contending with each other, and stops DB calls from
+# competing with everything else riding asyncio's shared default pool.
+_DB_EXECUTORS: dict[int, ThreadPoolExecutor] = {}
+
+
+def _db_executor(guild_id: int) -> ThreadPoolExecutor:
+    with _CACHE_LOCK:
+        ex = _DB_EXECUTORS.get(guild_id)
+        if ex is None:
+            ex = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"db-{guild_id}")
+            _DB_EXECUTORS[guild_id] = ex
+        return ex
+
+
+async def run_db(guild_id: int, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking DB function on the guild's dedicated DB thread.
+    Drop-in replacement for asyncio.to_thread at DB call sites.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _db_executor(int(guild_id)),
+        functools.partial(fn, *args, **kwargs),
+    )
+
+
+class GuildConnection(sqlite3.Connection):
+    """
+    sqlite3.Connection that ignores close().
+
+    Connections are cached per guild and shared across commands/threads;
+    the many existing `finally: conn.close()` call sites must not tear
+    them down. Use close_for_real() (via close_all_guild_dbs) to actually
+    release the handle.
+    """
+
+    guild_id: int
+
+    def close(self) -> None:  # type: ignore[override]
+        pass
+
+    def close_for_real(self) -> None:
+        super().close()
+
 
 def _apply_sqlite_pragmas(conn: sqlite3.Connection) -> None:
     conn.execute("PRAGMA foreign_keys = ON;")
     conn.execute("PRAGMA journal_mode = WAL;")
     conn.execute("PRAGMA synchronous = NORMAL;")
     conn.execute(f"PRAGMA busy_timeout = {_SQLITE_BUSY_TIMEOUT_MS};")
+    conn.execute("PRAGMA temp_store = MEMORY;")
+    conn.execute("PRAGMA cache_size = -20000;")  # ~20 MB page cache
+    conn.execute("PRAGMA mmap_size = 268435456;")  # 256 MB; reads skip the syscall path
 
 
 def connect_guild_db(guild_id: int) -> sqlite3.Connection:
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
-    db_path: Path = DATA_DIR / f"{guild_id}.db"
+    guild_id = int(guild_id)
+
+    with _CACHE_LOCK:
+        conn = _CONN_CACHE.get(guild_id)
+        if conn is not None:
+            return conn
+
+        DATA_DIR.mkdir(parents=True, exist_ok=True)
+        db_path: Path = DATA_DIR / f"{guild_id}.db"
+
+        conn = sqlite3.connect(
+            str(db_path),
+            check_same_thread=False,
+            timeout=30,
+            factory=GuildConnection,
+            # Connections live for the process, so a bigger prepared-
+            # statement cache means hot repo SQL is parsed/planned once.
+            cached_statements=256,
+        )
+        conn.row_factory = sqlite3.Row
+        # Repos can recover the owning guild from the connection (e.g. the
+        # settings write-through cache keys on it).
+        conn.guild_id = guild_id
+
+        _apply_sqlite_pragmas(conn)
+
+        # Create tables + apply migrations (once per process per guild)
+        init_schema(conn)
+
+        _CONN_CACHE[guild_id] = conn
+        log.info("[db] connect_guild_db guild_id=%s db_path=%s (cached)", guild_id, db_path)
+        return conn
+
+
+@contextmanager
+def guild_txn(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """
+    Group several repo writes into one transaction (one fsync), instead of
+    each statement committing on its own. Repo mutators that normally
+    commit themselves detect the open batch (via maybe_commit) and defer
+    to this block's single commit.
+
+    The open-batch marker records the owning thread id: only mutators on
+    the SAME thread defer their commit. A writer on another thread (e.g.
+    set_setting from the event loop while the guild DB thread is mid-
+    batch) must not silently ride this transaction, where a rollback
+    would discard its already-acknowledged write.
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    conn._guild_txn_owner = threading.get_ident()  # type: ignore[attr-defined]
+    try:
+        yield conn
+    except Exception:
+        conn.rollback()
+        raise
+    else:
+        conn.commit()
+    finally:
+        conn._guild_txn_owner = None  # type: ignore[attr-defined]
+
 
-    conn = sqlite3.connect(str(db_path), check_same_thread=False, timeout=30)
-    conn.row_factory = sqlite3.Row
+def maybe_commit(conn: sqlite3.Connection) -> None:
+    """
+    Commit unless the calling thread already opened a guild_txn batch
+    around us (writers on other threads still commit for themselves).
+    """
+    if getattr(conn, "_guild_txn_owner", None) == threading.get_ident():
+        return
+    conn.commit()
 
-    _apply_sqlite_pragmas(conn)
 
-    # Create tables + apply migrations
-    init_schema(conn)
+def close_all_guild_dbs() -> None:
+    """
+    Actually close every cached connection (shutdown/test cleanup only).
+    """
+    with _CACHE_LOCK:
+        for guild_id, ex in list(_DB_EXECUTORS.items()):
+            ex.shutdown(wait=True)
+        _DB_EXECUTORS.clear()
 
-    log.info("[db] connect_guild_db guild_id=%s db_path=%s", guild_id, db_path)
-    return conn
+        for guild_id, conn in list(_CONN_CACHE.items()):
+            try:
+                conn.close_for_real()
+            except Exception:
+                log.exception("[db] close failed guild_id=%s", guild_id)
+        _CONN_CACHE.clear()
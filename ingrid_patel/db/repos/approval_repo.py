@@ -1,9 +1,15 @@
 # ingrid_patel/db/repos/approval_repo.py
+#
+# Mutators here do NOT commit. Callers wrap one or more calls in
+# `with guild_txn(conn):` (see db/connect.py) so a command costs one
+# fsync instead of one per statement.
 
 from __future__ import annotations
 
 import sqlite3
-from ingrid_patel.utils.time import utc_now_iso, canonical_utc_iso
+from datetime import timedelta
+
+from ingrid_patel.utils.time import utc_now, utc_now_iso, canonical_utc_iso
 
 
 def get_active_approved_user(conn: sqlite3.Connection, discord_id: str) -> tuple[str, str | None] | None:
@@ -57,7 +63,6 @@ def approve_user(
         """,
         (discord_id, utc_now_iso(), approved_by_discord_id, note),
     )
-    conn.commit()
 
 
 def revoke_user(
@@ -78,7 +83,6 @@ def revoke_user(
         """,
         (utc_now_iso(), revoked_by_discord_id, note, discord_id),
     )
-    conn.commit()
 
 
 def list_approved(conn: sqlite3.Connection) -> list[tuple[str, str, str | None, str]]:
@@ -103,6 +107,44 @@ def list_approved(conn: sqlite3.Connection) -> list[tuple[str, str, str | None,
     return cur.fetchall()
 
 
+def check_and_touch_approved(
+    conn: sqlite3.Connection,
+    discord_id: str,
+    *,
+    inactivity_days: int,
+) -> bool:
+    """
+    One-shot approval gate for protected commands: checks the user is
+    approved and still active, auto-revokes if they've gone inactive, and
+    records the plex use — all on one connection so the caller can wrap it
+    in a single transaction.
+
+    Returns True if the user may proceed.
+    """
+    row = get_active_approved_user(conn, discord_id)
+    if not row:
+        return False
+
+    approved_at_utc, last_plex_use_at_utc = row
+    last_iso = last_plex_use_at_utc or approved_at_utc
+
+    # Timestamps are canonical fixed-width UTC ISO strings (utc_now_iso),
+    # so a lexicographic compare against the cutoff replaces a full
+    # datetime parse on every protected command.
+    cutoff_iso = (utc_now() - timedelta(days=inactivity_days)).isoformat()
+    if last_iso < cutoff_iso:
+        revoke_user(
+            conn,
+            discord_id=discord_id,
+            revoked_by_discord_id="system",
+            note=f"Auto-revoked: inactive > {inactivity_days} days",
+        )
+        return False
+
+    touch_plex_use(conn, discord_id)
+    return True
+
+
 def get_pending_request(
     conn: sqlite3.Connection,
     *,
@@ -145,7 +187,6 @@ def upsert_pending_request(
         """,
         (guild_id, discord_id, requested_at_utc, expires_at_utc, request_channel_id, request_message_id),
     )
-    conn.commit()
 
 
 def delete_pending_request(conn: sqlite3.Connection, *, guild_id: int, discord_id: str) -> None:
@@ -156,7 +197,28 @@ def delete_pending_request(conn: sqlite3.Connection, *, guild_id: int, discord_i
         """,
         (guild_id, discord_id),
     )
-    conn.commit()
+
+
+def delete_pending_requests_bulk(
+    conn: sqlite3.Connection,
+    pairs: list[tuple[int, int]],
+) -> None:
+    """
+    Delete many pending requests in one statement.
+
+    `pairs` is [(guild_id, request_message_id), ...] — e.g. everything an
+    expiration sweep collected from list_expired_pending_requests. One
+    executemany inside the caller's guild_txn beats a delete+commit per row.
+    """
+    if not pairs:
+        return
+    conn.executemany(
+        """
+        DELETE FROM approval_requests
+        WHERE guild_id = ? AND request_message_id = ?
+        """,
+        pairs,
+    )
 
 
 def delete_pending_request_by_message(
@@ -186,7 +248,6 @@ def delete_pending_request_by_message(
         """,
         (guild_id, request_message_id),
     )
-    conn.commit()
     return (discord_id, request_channel_id)
 
 
@@ -221,7 +282,24 @@ def touch_plex_use(conn: sqlite3.Connection, discord_id: str) -> None:
         """,
         (utc_now_iso(), discord_id),
     )
-    conn.commit()
+
+
+def touch_plex_use_bulk(conn: sqlite3.Connection, discord_ids: list[str]) -> None:
+    """
+    Bulk form of touch_plex_use for batched usage recording (e.g. a
+    scheduler flushing accumulated uses). One executemany, one timestamp.
+    """
+    if not discord_ids:
+        return
+    now_iso = utc_now_iso()
+    conn.executemany(
+        """
+        UPDATE approved_users
+        SET last_plex_use_at_utc = ?
+        WHERE discord_id = ? AND revoked_at_utc IS NULL
+        """,
+        [(now_iso, discord_id) for discord_id in discord_ids],
+    )
 
 
 def list_inactive_approved_users(conn: sqlite3.Connection, *, cutoff_utc_iso: str) -> list[str]:
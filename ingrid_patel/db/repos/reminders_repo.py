@@ -4,9 +4,54 @@ from __future__ import annotations
 
 import sqlite3
 from datetime import timedelta
-from typing import Optional
+from typing import Iterable, Iterator, Optional, Sequence
 
-from ingrid_patel.utils.time import utc_now_iso, utc_now, canonical_utc_iso
+from ingrid_patel.db.connect import maybe_commit
+from ingrid_patel.utils.time import utc_now_iso, utc_now, canonical_utc_iso, parse_iso
+
+
+# Unknown release dates are stored as this far-future sentinel, never NULL.
+# That keeps "unknowns last" a plain ORDER BY release_at_utc (index-ordered
+# scan, no temp B-tree) instead of sorting on a (release_at_utc IS NULL) key.
+_RELEASE_SENTINEL_ISO = "9999-12-31T00:00:00+00:00"
+
+# fetchmany batch size for the iter_* streaming readers.
+_FETCH_CHUNK = 512
+
+# Hot SQL hoisted to constants so every call hits sqlite3's per-connection
+# statement cache with the same string (connections are long-lived).
+_SQL_REMINDER_EXISTS = """
+    SELECT 1
+    FROM upcoming_games
+    WHERE app_id = ?
+      AND sent_at_utc IS NULL
+      AND remind_channel_id = ?
+    LIMIT 1
+"""
+_SQL_LIST_DUE = """
+    SELECT id, app_id, name, release_at_utc, remind_channel_id
+    FROM upcoming_games
+    WHERE sent_at_utc IS NULL
+      AND release_at_ts IS NOT NULL
+      AND release_at_ts BETWEEN ? AND ?
+    ORDER BY release_at_ts ASC
+"""
+
+
+def _iter_cursor(cur: sqlite3.Cursor) -> Iterator[tuple]:
+    """Yield rows in fetchmany batches instead of materializing fetchall."""
+    while True:
+        chunk = cur.fetchmany(_FETCH_CHUNK)
+        if not chunk:
+            return
+        yield from chunk
+
+
+def _epoch_ts(dt_iso: Optional[str]) -> Optional[int]:
+    """Epoch seconds for an ISO timestamp (release_at_ts shadow column)."""
+    if not dt_iso:
+        return None
+    return int(parse_iso(dt_iso).timestamp())
 
 
 def reminder_exists(conn: sqlite3.Connection, app_id: int, remind_channel_id: int | None) -> bool:
@@ -15,30 +60,21 @@ def reminder_exists(conn: sqlite3.Connection, app_id: int, remind_channel_id: in
 
     Note on scoping:
       - We scope reminders per-channel using remind_channel_id.
-      - For backwards compatibility, NULL remind_channel_id is treated as 0.
+      - "No channel" is stored as 0 (init_schema backfills legacy NULLs),
+        so the predicate compares the bare column and stays indexable.
     """
-    cur = conn.execute(
-        """
-        SELECT 1
-        FROM upcoming_games
-        WHERE app_id = ?
-          AND sent_at_utc IS NULL
-          AND COALESCE(remind_channel_id, 0) = COALESCE(?, 0)
-        LIMIT 1
-        """,
-        (int(app_id), int(remind_channel_id or 0)),
-    )
+    cur = conn.execute(_SQL_REMINDER_EXISTS, (int(app_id), int(remind_channel_id or 0)))
     return cur.fetchone() is not None
 
-def list_upcoming_reminders_for_channel(
+def iter_upcoming_reminders_for_channel(
     conn: sqlite3.Connection,
     *,
     channel_id: int,
-) -> list[tuple[int, int, str, Optional[str], str, str]]:
+) -> Iterator[tuple[int, int, str, Optional[str], str, str]]:
     """
-    Returns rows for THIS channel only:
+    Streams rows for THIS channel only:
       (id, app_id, name, release_at_utc, release_date_text, release_precision)
-    Only unsent reminders.
+    Only unsent reminders. The connection must stay open while consuming.
     """
     cur = conn.execute(
         """
@@ -51,12 +87,24 @@ def list_upcoming_reminders_for_channel(
             COALESCE(release_precision, 'unknown')
         FROM upcoming_games
         WHERE sent_at_utc IS NULL
-          AND COALESCE(remind_channel_id, 0) = ?
-        ORDER BY (release_at_utc IS NULL) ASC, release_at_utc ASC
+          AND remind_channel_id = ?
+        ORDER BY release_at_utc ASC
         """,
         (int(channel_id),),
     )
-    return cur.fetchall()
+    return _iter_cursor(cur)
+
+
+def list_upcoming_reminders_for_channel(
+    conn: sqlite3.Connection,
+    *,
+    channel_id: int,
+) -> list[tuple[int, int, str, Optional[str], str, str]]:
+    """
+    List form of iter_upcoming_reminders_for_channel for callers that need
+    the rows after the connection hands off (e.g. across run_db threads).
+    """
+    return list(iter_upcoming_reminders_for_channel(conn, channel_id=channel_id))
 
 
 
@@ -77,20 +125,17 @@ def add_reminder_if_missing(
     Returns:
       - True if inserted
       - False if it already existed
-    """
-    if reminder_exists(conn, app_id, remind_channel_id):
-        return False
 
+    The uq_upcoming_unsent partial index makes this one INSERT OR IGNORE:
+    no separate existence SELECT, and no race between check and insert.
+    """
     # Keep your existing sentinel behavior for unknown release dates
-    if release_at_utc is None:
-        release_at_utc = "9999-12-31T00:00:00+00:00"
-    else:
-        release_at_utc = canonical_utc_iso(release_at_utc)
+    release_at_utc = canonical_utc_iso(release_at_utc) or _RELEASE_SENTINEL_ISO
 
 
-    conn.execute(
+    cur = conn.execute(
         """
-        INSERT INTO upcoming_games (
+        INSERT OR IGNORE INTO upcoming_games (
             app_id,
             name,
             release_at_utc,
@@ -100,9 +145,10 @@ def add_reminder_if_missing(
             remind_channel_id,
             created_by_discord_id,
             created_at_utc,
-            sent_at_utc
+            sent_at_utc,
+            release_at_ts
         )
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, NULL)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, NULL, ?)
         """,
         (
             int(app_id),
@@ -111,38 +157,99 @@ def add_reminder_if_missing(
             (release_precision or "unknown"),
             release_date_text,
             utc_now_iso(),
-            int(remind_channel_id) if remind_channel_id is not None else None,
+            int(remind_channel_id or 0),
             created_by_discord_id,
             utc_now_iso(),
+            _epoch_ts(release_at_utc),
         ),
     )
-    conn.commit()
-    return True
+    maybe_commit(conn)
+    return (cur.rowcount or 0) > 0
+
+
+def add_reminders_bulk(
+    conn: sqlite3.Connection,
+    items: Iterable[
+        tuple[int, str, Optional[str], Optional[str], Optional[str], Optional[str], Optional[int]]
+    ],
+) -> None:
+    """
+    Bulk form of add_reminder_if_missing for imports. Each item is
+    (app_id, name, release_at_utc, release_date_text, release_precision,
+    created_by_discord_id, remind_channel_id). One executemany reusing the
+    prepared INSERT OR IGNORE, one commit; duplicates are dropped by the
+    uq_upcoming_unsent partial index just like the single-row path.
+    """
+    now_iso = utc_now_iso()
+    rows = []
+    for (app_id, name, release_at_utc, release_date_text, release_precision,
+         created_by_discord_id, remind_channel_id) in items:
+        release_at_utc = canonical_utc_iso(release_at_utc) or _RELEASE_SENTINEL_ISO
+        rows.append(
+            (
+                int(app_id),
+                str(name),
+                release_at_utc,
+                (release_precision or "unknown"),
+                release_date_text,
+                now_iso,
+                int(remind_channel_id or 0),
+                created_by_discord_id,
+                now_iso,
+                _epoch_ts(release_at_utc),
+            )
+        )
+    if not rows:
+        return
+    conn.executemany(
+        """
+        INSERT OR IGNORE INTO upcoming_games (
+            app_id,
+            name,
+            release_at_utc,
+            release_precision,
+            release_date_text,
+            last_checked_at_utc,
+            remind_channel_id,
+            created_by_discord_id,
+            created_at_utc,
+            sent_at_utc,
+            release_at_ts
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, NULL, ?)
+        """,
+        rows,
+    )
+    maybe_commit(conn)
 
 
 def remove_reminder(conn: sqlite3.Connection, *, app_id: int, remind_channel_id: int | None) -> bool:
     """
     Remove an UNSENT reminder for (app_id, remind_channel_id).
     Returns True if removed, False if none existed.
+
+    "Did it delete anything" comes from the conn.total_changes delta
+    rather than cur.rowcount (same for the other delete functions).
     """
-    cur = conn.execute(
+    before = conn.total_changes
+    conn.execute(
         """
         DELETE FROM upcoming_games
         WHERE app_id = ?
           AND sent_at_utc IS NULL
-          AND COALESCE(remind_channel_id, 0) = COALESCE(?, 0)
+          AND remind_channel_id = ?
         """,
         (int(app_id), int(remind_channel_id or 0)),
     )
-    conn.commit()
-    return (cur.rowcount or 0) > 0
+    maybe_commit(conn)
+    return (conn.total_changes - before) > 0
 
 
-def list_upcoming_reminders(conn: sqlite3.Connection) -> list[tuple[int, int, str, Optional[str], str]]:
+def iter_upcoming_reminders(conn: sqlite3.Connection) -> Iterator[tuple[int, int, str, Optional[str], str]]:
     """
-    Returns rows:
+    Streams rows:
       (id, app_id, name, release_at_utc, release_date_text)
-    Only unsent reminders.
+    Only unsent reminders. The connection must stay open while consuming.
     """
     cur = conn.execute(
         """
@@ -154,10 +261,17 @@ def list_upcoming_reminders(conn: sqlite3.Connection) -> list[tuple[int, int, st
             COALESCE(release_date_text, '')
         FROM upcoming_games
         WHERE sent_at_utc IS NULL
-        ORDER BY (release_at_utc IS NULL) ASC, release_at_utc ASC
+        ORDER BY release_at_utc ASC
         """
     )
-    return cur.fetchall()
+    return _iter_cursor(cur)
+
+
+def list_upcoming_reminders(conn: sqlite3.Connection) -> list[tuple[int, int, str, Optional[str], str]]:
+    """
+    List form of iter_upcoming_reminders.
+    """
+    return list(iter_upcoming_reminders(conn))
 
 
 def list_due_reminders(
@@ -170,26 +284,24 @@ def list_due_reminders(
     Returns rows due between [start_utc_iso, end_utc_iso]:
       (id, app_id, name, release_at_utc, remind_channel_id)
     Only unsent reminders with non-null release_at_utc.
+
+    The range scan runs on the release_at_ts epoch shadow column (8-byte
+    integer compares on a partial index) rather than the ISO strings.
+    Every row this returns is sent in the same scheduler tick, so the
+    projection is exactly what the sender needs — there's no lighter
+    id-only prefilter worth a second round-trip. remind_channel_id is
+    read bare: 0 means "no channel" (init_schema backfills legacy NULLs).
     """
-    cur = conn.execute(
-        """
-        SELECT id, app_id, name, release_at_utc, COALESCE(remind_channel_id, 0)
-        FROM upcoming_games
-        WHERE sent_at_utc IS NULL
-          AND release_at_utc IS NOT NULL
-          AND release_at_utc BETWEEN ? AND ?
-        ORDER BY release_at_utc ASC
-        """,
-        (start_utc_iso, end_utc_iso),
-    )
+    cur = conn.execute(_SQL_LIST_DUE, (_epoch_ts(start_utc_iso), _epoch_ts(end_utc_iso)))
     return cur.fetchall()
 
 
-def list_unsent_for_refresh(conn: sqlite3.Connection) -> list[tuple[int, str]]:
+def iter_unsent_for_refresh(conn: sqlite3.Connection) -> Iterator[tuple[int, str]]:
     """
-    Returns:
+    Streams:
       (app_id, release_date_text)
-    for all unsent reminders (used by refresh job).
+    for all unsent reminders. The connection must stay open while consuming,
+    and the consumer must not write upcoming_games mid-iteration.
     """
     cur = conn.execute(
         """
@@ -198,7 +310,16 @@ def list_unsent_for_refresh(conn: sqlite3.Connection) -> list[tuple[int, str]]:
         WHERE sent_at_utc IS NULL
         """,
     )
-    return cur.fetchall()
+    return _iter_cursor(cur)
+
+
+def list_unsent_for_refresh(conn: sqlite3.Connection) -> list[tuple[int, str]]:
+    """
+    List form of iter_unsent_for_refresh — the refresh job uses this one
+    because it updates upcoming_games while walking the rows, which isn't
+    safe against a live cursor on the same table.
+    """
+    return list(iter_unsent_for_refresh(conn))
 
 
 def update_release_fields(
@@ -213,12 +334,13 @@ def update_release_fields(
     Update release fields for UNSENT reminders for app_id.
     We normalize timestamps so SQLite ordering is consistent.
     """
-    norm_release = canonical_utc_iso(release_at_utc)
+    norm_release = canonical_utc_iso(release_at_utc) or _RELEASE_SENTINEL_ISO
 
     conn.execute(
         """
         UPDATE upcoming_games
         SET release_at_utc = ?,
+            release_at_ts = ?,
             release_date_text = ?,
             release_precision = ?,
             last_checked_at_utc = ?
@@ -226,15 +348,57 @@ def update_release_fields(
         """,
         (
             norm_release,
+            _epoch_ts(norm_release),
             release_date_text,
             (release_precision or "unknown"),
             utc_now_iso(),
             int(app_id),
         ),
     )
-    conn.commit()
+    maybe_commit(conn)
+
 
 
+def update_release_fields_bulk(
+    conn: sqlite3.Connection,
+    items: Iterable[tuple[int, Optional[str], Optional[str], Optional[str]]],
+) -> None:
+    """
+    Bulk form of update_release_fields for the daily refresh job. Each
+    item is (app_id, release_at_utc, release_date_text, release_precision);
+    one executemany and one commit instead of a transaction (and fsync)
+    per changed app.
+    """
+    now_iso = utc_now_iso()
+    rows = []
+    for (app_id, release_at_utc, release_date_text, release_precision) in items:
+        norm_release = canonical_utc_iso(release_at_utc) or _RELEASE_SENTINEL_ISO
+        rows.append(
+            (
+                norm_release,
+                _epoch_ts(norm_release),
+                release_date_text,
+                (release_precision or "unknown"),
+                now_iso,
+                int(app_id),
+            )
+        )
+    if not rows:
+        return
+    conn.executemany(
+        """
+        UPDATE upcoming_games
+        SET release_at_utc = ?,
+            release_at_ts = ?,
+            release_date_text = ?,
+            release_precision = ?,
+            last_checked_at_utc = ?
+        WHERE app_id = ? AND sent_at_utc IS NULL
+        """,
+        rows,
+    )
+    maybe_commit(conn)
+
 
 def mark_sent(conn: sqlite3.Connection, reminder_id: int) -> None:
     """
@@ -248,7 +412,22 @@ def mark_sent(conn: sqlite3.Connection, reminder_id: int) -> None:
         """,
         (utc_now_iso(), int(reminder_id)),
     )
-    conn.commit()
+    maybe_commit(conn)
+
+
+def mark_sent_bulk(conn: sqlite3.Connection, reminder_ids: Sequence[int]) -> None:
+    """
+    Mark many reminder rows as sent in one statement and one commit.
+    The per-row loop this replaces paid one fsync per reminder.
+    """
+    if not reminder_ids:
+        return
+    placeholders = ",".join("?" * len(reminder_ids))
+    conn.execute(
+        f"UPDATE upcoming_games SET sent_at_utc = ? WHERE id IN ({placeholders})",
+        (utc_now_iso(), *[int(rid) for rid in reminder_ids]),
+    )
+    maybe_commit(conn)
 
 
 def purge_expired_reminders(conn: sqlite3.Connection) -> int:
@@ -259,17 +438,21 @@ def purge_expired_reminders(conn: sqlite3.Connection) -> int:
     Returns number of rows removed.
     """
     cutoff = (utc_now() - timedelta(hours=36)).isoformat()
-    cur = conn.execute(
+
+    # Two DELETEs instead of one OR across different columns: SQLite can't
+    # serve the disjunction from a single index and would scan the table.
+    # Each statement uses its own (partial) index, and sqlite3's implicit
+    # transaction keeps them under the one commit below. One
+    # total_changes delta covers both statements.
+    before = conn.total_changes
+    conn.execute("DELETE FROM upcoming_games WHERE sent_at_utc IS NOT NULL")
+    conn.execute(
         """
         DELETE FROM upcoming_games
-        WHERE sent_at_utc IS NOT NULL
-           OR (
-                release_at_utc IS NOT NULL
-            AND release_precision = 'day'
-            AND release_at_utc < ?
-           )
+        WHERE release_precision = 'day'
+          AND release_at_utc < ?
         """,
         (cutoff,),
     )
-    conn.commit()
-    return cur.rowcount or 0
+    maybe_commit(conn)
+    return conn.total_changes - before
@@ -3,14 +3,52 @@
 from __future__ import annotations
 
 import sqlite3
+import time
 from typing import Optional
 
+from ingrid_patel.db.connect import maybe_commit
+
+# Short-TTL read cache for settings that rarely change (timezone,
+# allowed_channel_id) but get read on every message. set_setting /
+# set_setting_if_changed write through to it, so in-process writers never
+# serve a stale value; the TTL only bounds staleness against out-of-band
+# edits to the DB file.
+_SETTINGS_CACHE: dict[tuple[int, str], tuple[float, Optional[str]]] = {}
+_SETTINGS_CACHE_TTL_S = 60.0
+
+# Hot SQL hoisted to constants: every call passes the same string object,
+# so sqlite3's per-connection statement cache hits without rehashing a
+# fresh literal (connections are long-lived, see connect_guild_db).
+_SQL_GET_SETTING = "SELECT value FROM settings WHERE key = ? LIMIT 1"
+_SQL_UPSERT_SETTING = """
+    INSERT INTO settings(key, value)
+    VALUES(?, ?)
+    ON CONFLICT(key) DO UPDATE SET value=excluded.value
+"""
+_SQL_UPSERT_SETTING_IF_CHANGED = """
+    INSERT INTO settings(key, value)
+    VALUES(?, ?)
+    ON CONFLICT(key) DO UPDATE SET value=excluded.value
+    WHERE settings.value IS NOT excluded.value
+"""
+
+
+def _cache_write_through(conn: sqlite3.Connection, key: str, value: str) -> None:
+    guild_id = getattr(conn, "guild_id", None)
+    if guild_id is None:
+        return
+    normalized = str(value).strip() or None
+    _SETTINGS_CACHE[(int(guild_id), key)] = (
+        time.monotonic() + _SETTINGS_CACHE_TTL_S,
+        normalized,
+    )
+
 
 def get_setting(conn: sqlite3.Connection, key: str) -> Optional[str]:
     """
     Returns the setting value as a stripped string, or None if missing/NULL/blank.
     """
-    cur = conn.execute("SELECT value FROM settings WHERE key = ? LIMIT 1", (key,))
+    cur = conn.execute(_SQL_GET_SETTING, (key,))
     row = cur.fetchone()
     if not row:
         return None
@@ -41,19 +79,74 @@ def get_int_setting(conn: sqlite3.Connection, key: str) -> Optional[int]:
         return None
 
 
+def get_all_settings(conn: sqlite3.Connection) -> dict[str, Optional[str]]:
+    """
+    Every settings row in one SELECT, values normalized like get_setting
+    (stripped; blank/NULL becomes None).
+    """
+    out: dict[str, Optional[str]] = {}
+    for row in conn.execute("SELECT key, value FROM settings"):
+        val = row[1]
+        s = str(val).strip() if val is not None else ""
+        out[str(row[0])] = s or None
+    return out
+
+
+def get_setting_cached(
+    conn: sqlite3.Connection,
+    guild_id: int,
+    key: str,
+    *,
+    ttl_s: float = _SETTINGS_CACHE_TTL_S,
+) -> Optional[str]:
+    """
+    Like get_setting, but serves repeat reads from an in-memory cache for
+    ttl_s seconds so hot paths skip the SQLite round-trip.
+
+    A miss loads the whole settings table (a handful of rows) in one
+    SELECT and primes the cache for every key, so consumers that read
+    several keys back-to-back (the scheduler tick reads timezone, the
+    allowed channel, and three last-run gates) pay one query, not one
+    per key. Sibling keys get the default TTL; only the requested key
+    honors the caller's ttl_s.
+    """
+    gid = int(guild_id)
+    cache_key = (gid, key)
+    hit = _SETTINGS_CACHE.get(cache_key)
+    now = time.monotonic()
+    if hit is not None and now < hit[0]:
+        return hit[1]
+
+    vals = get_all_settings(conn)
+    default_expiry = now + _SETTINGS_CACHE_TTL_S
+    for k, v in vals.items():
+        if k != key:
+            _SETTINGS_CACHE[(gid, k)] = (default_expiry, v)
+
+    val = vals.get(key)
+    _SETTINGS_CACHE[cache_key] = (now + ttl_s, val)
+    return val
+
+
+def invalidate_setting_cache(guild_id: int, key: Optional[str] = None) -> None:
+    """
+    Drop cached value(s) for a guild (all keys if key is None).
+    """
+    if key is not None:
+        _SETTINGS_CACHE.pop((int(guild_id), key), None)
+        return
+    gid = int(guild_id)
+    for cache_key in [k for k in _SETTINGS_CACHE if k[0] == gid]:
+        _SETTINGS_CACHE.pop(cache_key, None)
+
+
 def set_setting(conn: sqlite3.Connection, key: str, value: str) -> None:
     """
     Upserts the setting. Always commits.
     """
-    conn.execute(
-        """
-        INSERT INTO settings(key, value)
-        VALUES(?, ?)
-        ON CONFLICT(key) DO UPDATE SET value=excluded.value
-        """,
-        (key, str(value)),
-    )
-    conn.commit()
+    conn.execute(_SQL_UPSERT_SETTING, (key, str(value)))
+    maybe_commit(conn)
+    _cache_write_through(conn, key, value)
 
 
 def set_setting_if_changed(conn: sqlite3.Connection, key: str, value: str) -> bool:
@@ -62,27 +155,12 @@ def set_setting_if_changed(conn: sqlite3.Connection, key: str, value: str) -> bo
     Returns True if an update occurred, False otherwise.
     """
     new_val = str(value)
-    cur = conn.execute("SELECT value FROM settings WHERE key = ? LIMIT 1", (key,))
-    row = cur.fetchone()
-
-    old_val = None
-    if row:
-        try:
-            old_val = row["value"]
-        except Exception:
-            old_val = row[0]
-
-    # Normalize NULL vs string, and avoid writing if identical
-    if old_val is not None and str(old_val) == new_val:
-        return False
-
-    conn.execute(
-        """
-        INSERT INTO settings(key, value)
-        VALUES(?, ?)
-        ON CONFLICT(key) DO UPDATE SET value=excluded.value
-        """,
-        (key, new_val),
-    )
-    conn.commit()
-    return True
+    # One conditional upsert instead of SELECT + compare + INSERT: the
+    # DO UPDATE ... WHERE clause makes SQLite skip the write (rowcount 0)
+    # when the stored value already matches, halving the round-trips.
+    cur = conn.execute(_SQL_UPSERT_SETTING_IF_CHANGED, (key, new_val))
+    changed = (cur.rowcount or 0) > 0
+    if changed:
+        maybe_commit(conn)
+        _cache_write_through(conn, key, new_val)
+    return changed
@@ -3,21 +3,23 @@
 from __future__ import annotations
 
 import sqlite3
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
+from ingrid_patel.db.connect import maybe_commit
 from ingrid_patel.utils.time import utc_now_iso
 
+# Hot SQL hoisted to a constant so every call hits sqlite3's per-connection
+# statement cache with the same string (connections are long-lived).
+_SQL_IS_IN_WISHLIST = """
+    SELECT 1
+    FROM channel_wishlist
+    WHERE channel_id = ? AND app_id = ?
+    LIMIT 1
+"""
+
 
 def is_in_wishlist(conn: sqlite3.Connection, *, channel_id: int, app_id: int) -> bool:
-    cur = conn.execute(
-        """
-        SELECT 1
-        FROM channel_wishlist
-        WHERE channel_id = ? AND app_id = ?
-        LIMIT 1
-        """,
-        (int(channel_id), int(app_id)),
-    )
+    cur = conn.execute(_SQL_IS_IN_WISHLIST, (int(channel_id), int(app_id)))
     return cur.fetchone() is not None
 
 
@@ -48,28 +50,87 @@ def add_to_wishlist_if_missing(
         """,
         (int(channel_id), int(app_id), str(name), (added_by_discord_id or None), utc_now_iso()),
     )
-    conn.commit()
+    maybe_commit(conn)
     return True
 
 
+def add_wishlist_items_bulk(
+    conn: sqlite3.Connection,
+    items: Iterable[tuple[int, int, str, Optional[str]]],
+) -> None:
+    """
+    Bulk insert for imports: (channel_id, app_id, name, added_by_discord_id).
+    One executemany with INSERT OR IGNORE against the (channel_id, app_id)
+    PK and one commit, instead of a check + insert + commit per row.
+    """
+    now_iso = utc_now_iso()
+    conn.executemany(
+        """
+        INSERT OR IGNORE INTO channel_wishlist (
+            channel_id,
+            app_id,
+            name,
+            added_by_discord_id,
+            created_at_utc
+        )
+        VALUES (?, ?, ?, ?, ?)
+        """,
+        [
+            (int(channel_id), int(app_id), str(name), (added_by or None), now_iso)
+            for (channel_id, app_id, name, added_by) in items
+        ],
+    )
+    maybe_commit(conn)
+
+
 def remove_from_wishlist(conn: sqlite3.Connection, *, channel_id: int, app_id: int) -> bool:
     """
-    Returns True if removed, False if nothing was removed.
+    Returns True if removed, False if nothing was removed
+    (conn.total_changes delta, as in reminders_repo.remove_reminder).
     """
-    cur = conn.execute(
+    before = conn.total_changes
+    conn.execute(
         """
         DELETE FROM channel_wishlist
         WHERE channel_id = ? AND app_id = ?
         """,
         (int(channel_id), int(app_id)),
     )
-    conn.commit()
-    return (cur.rowcount or 0) > 0
+    maybe_commit(conn)
+    return (conn.total_changes - before) > 0
 
 
-def list_wishlist(conn: sqlite3.Connection) -> list[tuple[int, int, str]]:
+def iter_wishlist_for_channel(conn: sqlite3.Connection, *, channel_id: int) -> Iterator[tuple[int, int, str]]:
+    """
+    Streams rows for ONE channel: (channel_id, app_id, name).
+    Filtering in SQL lets SQLite seek the (channel_id, app_id) primary key,
+    and yielding straight off the cursor avoids materializing an
+    intermediate fetchall list.
+    """
+    cur = conn.execute(
+        """
+        SELECT channel_id, app_id, name
+        FROM channel_wishlist
+        WHERE channel_id = ?
+        ORDER BY created_at_utc ASC
+        """,
+        (int(channel_id),),
+    )
+    for r in cur:
+        yield (int(r[0]), int(r[1]), str(r[2]))
+
+
+def list_wishlist_for_channel(conn: sqlite3.Connection, *, channel_id: int) -> list[tuple[int, int, str]]:
+    """
+    List form of iter_wishlist_for_channel for callers that need random access.
+    """
+    return list(iter_wishlist_for_channel(conn, channel_id=channel_id))
+
+
+def iter_wishlist(conn: sqlite3.Connection) -> Iterator[tuple[int, int, str]]:
     """
-    Returns rows: (channel_id, app_id, name)
+    Streams rows across all channels: (channel_id, app_id, name).
+    The connection must stay open while consuming.
     """
     cur = conn.execute(
         """
@@ -78,4 +139,17 @@ def list_wishlist(conn: sqlite3.Connection) -> list[tuple[int, int, str]]:
         ORDER BY channel_id ASC, created_at_utc ASC
         """
     )
-    return [(int(r[0]), int(r[1]), str(r[2])) for r in cur.fetchall()]
+    while True:
+        chunk = cur.fetchmany(512)
+        if not chunk:
+            return
+        for r in chunk:
+            yield (int(r[0]), int(r[1]), str(r[2]))
+
+
+def list_wishlist(conn: sqlite3.Connection) -> list[tuple[int, int, str]]:
+    """
+    List form of iter_wishlist — the wishlist job uses this one because it
+    closes the connection before consuming the rows.
+    """
+    return list(iter_wishlist(conn))
@@ -7,25 +7,87 @@ import logging
 
 log = logging.getLogger(__name__)
 
+# Bump when init_schema gains a new table/index/backfill. DBs stamped at
+# this version skip the whole body (version 1 was the WITHOUT ROWID
+# rebuild; 2 added the stamp itself).
+_SCHEMA_VERSION = 2
+
 
 def _has_column(conn: sqlite3.Connection, table: str, col: str) -> bool:
     cur = conn.execute(f"PRAGMA table_info({table})")
     return any((row[1] == col) for row in cur.fetchall())
 
 
+def _migrate_to_without_rowid(conn: sqlite3.Connection) -> None:
+    """
+    One-time rebuild of settings / channel_wishlist as WITHOUT ROWID for
+    DBs created before the table definitions gained the clause (gated on
+    user_version; CREATE TABLE IF NOT EXISTS can't alter existing tables).
+    """
+    (user_version,) = conn.execute("PRAGMA user_version").fetchone()
+    if user_version >= 1:
+        return
+
+    for table, create_sql, columns in (
+        (
+            "settings",
+            "CREATE TABLE {name} (key TEXT PRIMARY KEY, value TEXT) WITHOUT ROWID",
+            "key, value",
+        ),
+        (
+            "channel_wishlist",
+            """
+            CREATE TABLE {name} (
+                channel_id        INTEGER NOT NULL,
+                app_id            INTEGER NOT NULL,
+                name              TEXT NOT NULL,
+                added_by_discord_id TEXT,
+                created_at_utc    TEXT,
+                PRIMARY KEY (channel_id, app_id)
+            ) WITHOUT ROWID
+            """,
+            "channel_id, app_id, name, added_by_discord_id, created_at_utc",
+        ),
+    ):
+        row = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type='table' AND name=?", (table,)
+        ).fetchone()
+        if not row or "WITHOUT ROWID" in (row[0] or ""):
+            continue
+
+        log.info("[db] rebuilding %s as WITHOUT ROWID", table)
+        tmp = f"{table}_wr"
+        conn.execute(create_sql.format(name=tmp))
+        conn.execute(f"INSERT INTO {tmp} ({columns}) SELECT {columns} FROM {table}")
+        conn.execute(f"DROP TABLE {table}")
+        conn.execute(f"ALTER TABLE {tmp} RENAME TO {table}")
+
+    conn.execute("PRAGMA user_version = 1")
+
+
 def init_schema(conn: sqlite3.Connection) -> None:
     """
     Create tables needed by the bot (idempotent).
     Lightweight migrations are handled by checking for missing columns.
+
+    The whole body is gated on PRAGMA user_version: once a DB is stamped
+    at _SCHEMA_VERSION, this returns after a single PRAGMA read instead
+    of re-running every CREATE IF NOT EXISTS, table_info probe, and
+    backfill UPDATE on each startup.
     """
+    (user_version,) = conn.execute("PRAGMA user_version").fetchone()
+    if user_version >= _SCHEMA_VERSION:
+        return
 
     # --- settings (per-guild) ---
+    # WITHOUT ROWID: key-value lookups descend the PK B-tree directly
+    # instead of going index -> rowid -> row (same for channel_wishlist).
     conn.execute(
         """
         CREATE TABLE IF NOT EXISTS settings (
             key   TEXT PRIMARY KEY,
             value TEXT
-        )
+        ) WITHOUT ROWID
         """
     )
 
@@ -44,6 +106,15 @@ def init_schema(conn: sqlite3.Connection) -> None:
         """
     )
 
+    # Partial covering index for the hot "is this user approved" lookup;
+    # revoked rows cost nothing here.
+    conn.execute(
+        """
+        CREATE UNIQUE INDEX IF NOT EXISTS ix_approved_active
+        ON approved_users(discord_id) WHERE revoked_at_utc IS NULL
+        """
+    )
+
     # --- pending plex approval requests (per-guild) ---
     conn.execute(
         """
@@ -85,14 +156,53 @@ def init_schema(conn: sqlite3.Connection) -> None:
     )
     conn.execute(
         """
-        CREATE INDEX IF NOT EXISTS idx_upcoming_games_due
-        ON upcoming_games(sent_at_utc, release_at_utc)
+        CREATE INDEX IF NOT EXISTS idx_upcoming_games_app
+        ON upcoming_games(app_id)
         """
     )
+
+    # remind_channel_id uses 0 (not NULL) for "no channel" so queries can
+    # compare the bare column — wrapping it in COALESCE would stop the
+    # planner from using an index and force a table scan.
+    conn.execute("UPDATE upcoming_games SET remind_channel_id = 0 WHERE remind_channel_id IS NULL")
+
+    # Every hot reminder query carries "sent_at_utc IS NULL", so partial
+    # indexes keep the B-trees to just live reminders: sent history costs
+    # neither maintenance nor page reads. Earlier full-width variants are
+    # dropped in favor of these.
+    conn.execute("DROP INDEX IF EXISTS idx_upcoming_games_due")
+    conn.execute("DROP INDEX IF EXISTS idx_upcoming_games_channel_unsent")
     conn.execute(
         """
-        CREATE INDEX IF NOT EXISTS idx_upcoming_games_app
-        ON upcoming_games(app_id)
+        CREATE INDEX IF NOT EXISTS idx_upcoming_games_due_live
+        ON upcoming_games(release_at_utc) WHERE sent_at_utc IS NULL
+        """
+    )
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_upcoming_games_live_channel
+        ON upcoming_games(remind_channel_id, release_at_utc) WHERE sent_at_utc IS NULL
+        """
+    )
+    # At most one live reminder per (app, channel); lets
+    # add_reminder_if_missing be a single INSERT OR IGNORE with no
+    # check-then-insert race. Dedupe first so the unique index can build
+    # on DBs that accumulated duplicates under the old check-then-insert.
+    conn.execute(
+        """
+        DELETE FROM upcoming_games
+        WHERE sent_at_utc IS NULL
+          AND id NOT IN (
+            SELECT MIN(id) FROM upcoming_games
+            WHERE sent_at_utc IS NULL
+            GROUP BY app_id, remind_channel_id
+          )
+        """
+    )
+    conn.execute(
+        """
+        CREATE UNIQUE INDEX IF NOT EXISTS uq_upcoming_unsent
+        ON upcoming_games(app_id, remind_channel_id) WHERE sent_at_utc IS NULL
         """
     )
 
@@ -106,10 +216,12 @@ def init_schema(conn: sqlite3.Connection) -> None:
             added_by_discord_id TEXT,
             created_at_utc    TEXT,
             PRIMARY KEY (channel_id, app_id)
-        )
+        ) WITHOUT ROWID
         """
     )
 
+    _migrate_to_without_rowid(conn)
+
     # --- tiny migrations (column adds) ---
     # If you ever ran an older DB missing some columns, this keeps you from crashing.
     # approved_users.last_plex_use_at_utc
@@ -133,4 +245,43 @@ def init_schema(conn: sqlite3.Connection) -> None:
         except Exception:
             pass
 
+    # upcoming_games.release_at_ts: epoch-seconds shadow of release_at_utc.
+    # The due-window BETWEEN scan compares 8-byte integers instead of
+    # 25-char ISO strings; repos keep both columns in sync on write.
+    if not _has_column(conn, "upcoming_games", "release_at_ts"):
+        try:
+            conn.execute("ALTER TABLE upcoming_games ADD COLUMN release_at_ts INTEGER")
+        except Exception:
+            pass
+    # Unknown release dates use a far-future sentinel rather than NULL so
+    # listings can ORDER BY release_at_utc straight off the partial indexes.
+    conn.execute(
+        """
+        UPDATE upcoming_games
+        SET release_at_utc = '9999-12-31T00:00:00+00:00'
+        WHERE release_at_utc IS NULL
+        """
+    )
+    conn.execute(
+        """
+        UPDATE upcoming_games
+        SET release_at_ts = CAST(strftime('%s', release_at_utc) AS INTEGER)
+        WHERE release_at_ts IS NULL AND release_at_utc IS NOT NULL
+        """
+    )
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_upcoming_ts
+        ON upcoming_games(release_at_ts) WHERE sent_at_utc IS NULL
+        """
+    )
+    # Serves purge_expired_reminders' day-precision expiry DELETE.
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_upcoming_day_expiry
+        ON upcoming_games(release_at_utc) WHERE release_precision = 'day'
+        """
+    )
+
+    conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
     conn.commit()
@@ -3,12 +3,22 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 from ingrid_patel.db.connect import connect_guild_db
 from ingrid_patel.db.repos.reminders_repo import list_due_reminders
 
 
+@lru_cache(maxsize=64)
+def _tz(tz_name: str) -> ZoneInfo:
+    """
+    ZoneInfo per guild timezone, memoized — the scheduler resolves the
+    same few names every tick.
+    """
+    return ZoneInfo(tz_name)
+
+
 def check_and_collect_tomorrow_reminders(
     guild_id: int,
     *,
@@ -19,12 +29,20 @@ def check_and_collect_tomorrow_reminders(
       (reminder_id, app_id, name, release_at_utc, remind_channel_id)
 
     If tz_name is missing/invalid, returns [] (guild not configured yet).
+
+    This stays one query per guild on purpose. Folding all guilds into a
+    single ATTACH + UNION ALL statement was considered and rejected: each
+    guild's "tomorrow" window is computed in its own timezone (so the
+    BETWEEN bounds differ per arm), SQLite caps attached databases at 10,
+    and attaching files sidesteps the cached, schema-migrated connections
+    everything else uses. The per-guild query is one indexed range scan
+    on an already-open connection — there's no round-trip worth saving.
     """
     if not tz_name:
         return []
 
     try:
-        tz = ZoneInfo(tz_name)
+        tz = _tz(tz_name)
     except Exception:
         return []
 
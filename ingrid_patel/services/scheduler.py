@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from collections import deque
+from functools import lru_cache
 from typing import Any
 from datetime import datetime
 
@@ -11,16 +15,16 @@ from discord import Client
 from discord.ext import tasks
 from zoneinfo import ZoneInfo
 
-from ingrid_patel.db.repos.settings_repo import get_setting, set_setting
+from ingrid_patel.db.repos.settings_repo import get_setting_cached, set_setting
 from ingrid_patel.clients.steam_client import SteamClient
 from ingrid_patel.services.reminder_scheduler import check_and_collect_tomorrow_reminders
-from ingrid_patel.db.connect import connect_guild_db
+from ingrid_patel.db.connect import connect_guild_db, run_db
 from ingrid_patel.db.repos.wishlist_repo import list_wishlist
 from ingrid_patel.db.repos.reminders_repo import (
     purge_expired_reminders,
-    mark_sent,
+    mark_sent_bulk,
     list_unsent_for_refresh,
-    update_release_fields,
+    update_release_fields_bulk,
 )
 from ingrid_patel.utils.time import parse_steam_release_date
 from ingrid_patel.settings import (
@@ -32,20 +36,40 @@ from ingrid_patel.settings import (
 
 log = logging.getLogger(__name__)
 
+# Normalized once at import instead of int()-ing inside per-guild loops.
+_TEST_GUILD_ID_INT = int(TEST_GUILD_ID)
+_TEST_CHANNEL_ID_INT = int(TEST_CHANNEL_ID)
 
 
 
 
+
+@lru_cache(maxsize=64)
+def _tz(tz_name: str) -> ZoneInfo | None:
+    """
+    ZoneInfo per configured timezone name, memoized across ticks; invalid
+    names cache as None so they aren't re-validated every 30 seconds.
+    """
+    try:
+        return ZoneInfo(tz_name)
+    except Exception:
+        return None
+
+
 def _get_guild_timezone(guild_id: int) -> str | None:
     """
     Returns stored IANA timezone name (settings.timezone) or None if not configured.
+
+    Reads through the settings TTL cache: the tick polls this for every
+    guild every 30s, and set_setting writes through the cache, so the
+    steady state costs a dict lookup instead of a SQLite query.
     """
-    if TESTING_MODE and int(guild_id) == int(TEST_GUILD_ID):
+    if TESTING_MODE and int(guild_id) == _TEST_GUILD_ID_INT:
         return str(TEST_TIMEZONE)
 
     conn = connect_guild_db(guild_id)
     try:
-        tz = (get_setting(conn, "timezone") or "").strip()
+        tz = (get_setting_cached(conn, guild_id, "timezone") or "").strip()
     finally:
         conn.close()
     return tz or None
@@ -56,11 +80,11 @@ def _get_guild_allowed_channel_id(guild_id: int) -> int | None:
     Returns stored allowed channel id (settings.allowed_channel_id) or None if not configured.
     """
     if TESTING_MODE:
-        return int(TEST_CHANNEL_ID) if int(guild_id) == int(TEST_GUILD_ID) else None
+        return _TEST_CHANNEL_ID_INT if int(guild_id) == _TEST_GUILD_ID_INT else None
 
     conn = connect_guild_db(guild_id)
     try:
-        v = (get_setting(conn, "allowed_channel_id") or "").strip()
+        v = (get_setting_cached(conn, guild_id, "allowed_channel_id") or "").strip()
     finally:
         conn.close()
 
@@ -78,20 +102,43 @@ def _get_guild_allowed_channel_id(guild_id: int) -> int | None:
 # "Run once per day" gate
 # -------------------------
 
-def _in_local_window(now_local: datetime, *, hour: int, minute: int, window_seconds: int = 120) -> bool:
+# Daily window targets as local seconds-of-day; comparing plain ints
+# avoids building a datetime and a timedelta per window per guild per tick.
+_REFRESH_SEC = 17 * 3600 + 55 * 60     # 17:55 local
+_REMINDERS_SEC = 18 * 3600             # 18:00 local
+_WISHLIST_SEC = 18 * 3600 + 3 * 60     # 18:03 local
+
+
+def _in_local_window(sec_of_day: int, target_sec: int, window_seconds: int = 120) -> bool:
     """
-    True if now_local is within [target, target + window_seconds).
+    True if sec_of_day is within [target_sec, target_sec + window_seconds).
     """
-    target = now_local.replace(hour=hour, minute=minute, second=0, microsecond=0)
-    delta = (now_local - target).total_seconds()
+    delta = sec_of_day - target_sec
     return 0 <= delta < window_seconds
 
 
-def _should_run_today(conn, *, key: str, local_ymd: str) -> bool:
+# The last-run ymd keys only change when this process writes them (via
+# set_setting, which writes through the cache), so a long TTL just means
+# the gate stays a dict hit between runs instead of re-reading SQLite
+# once a minute. A stale hit can only hold yesterday's ymd, which makes
+# the gate open — never a wrongly skipped run. First read after a
+# restart re-hydrates from the DB row, the durable copy.
+_RAN_TODAY_TTL_S = 6 * 3600.0
+
+
+def _should_run_today(guild_id: int, *, key: str, local_ymd: str) -> bool:
     """
     Returns True if settings[key] != local_ymd. If True, caller should run then set it.
+
+    Pure in-memory check in steady state: the connection is the cached
+    per-guild handle and the read is a settings-cache dict hit, so ticks
+    outside an open window touch no SQLite at all.
     """
-    last = (get_setting(conn, key) or "").strip()
+    conn = connect_guild_db(guild_id)
+    try:
+        last = (get_setting_cached(conn, guild_id, key, ttl_s=_RAN_TODAY_TTL_S) or "").strip()
+    finally:
+        conn.close()
     return last != local_ymd
 
 
@@ -99,69 +146,160 @@ def _should_run_today(conn, *, key: str, local_ymd: str) -> bool:
 # Discord send helpers
 # -------------------------
 
-async def _send_embeds_compat(
+class _ChannelSendLimiter:
+    """
+    Rolling-window token bucket matching Discord's per-channel message
+    bucket (5 sends / 5 s). Pacing ourselves is cheaper than tripping a
+    429 and riding discord.py's retry path.
+    """
+
+    def __init__(self, rate: int = 5, per_s: float = 5.0) -> None:
+        self._rate = rate
+        self._per_s = per_s
+        self._sent_at: deque[float] = deque()
+        self._lock = asyncio.Lock()
+
+    def _drop_expired(self, now: float) -> None:
+        while self._sent_at and now - self._sent_at[0] >= self._per_s:
+            self._sent_at.popleft()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            self._drop_expired(now)
+            if len(self._sent_at) >= self._rate:
+                await asyncio.sleep(self._per_s - (now - self._sent_at[0]))
+                self._drop_expired(time.monotonic())
+            self._sent_at.append(time.monotonic())
+
+
+_CHANNEL_LIMITERS: dict[int, _ChannelSendLimiter] = {}
+
+
+def _limiter_for(channel_id: int) -> _ChannelSendLimiter:
+    return _CHANNEL_LIMITERS.setdefault(int(channel_id), _ChannelSendLimiter())
+
+async def _send_embeds(
     channel: discord.abc.Messageable,
     *,
     content: str | None = None,
     embeds: list[discord.Embed] | None = None,
 ) -> None:
     """
-    Send embeds in a way that works across discord.py / forks.
-    - Prefer a single message with `embeds=[...]`.
-    - Fallback to sending header + each embed individually if `embeds` kwarg isn't supported.
+    Send content plus embeds in a single message. We pin discord.py in
+    requirements.txt, so `embeds=` is always accepted; the old per-call
+    try/except TypeError probe and per-embed fallback sends are gone.
     """
-    embeds = embeds or []
-
-    # Nothing to embed -> just send content if present
     if not embeds:
         if content:
             await channel.send(content)
         return
 
-    # Try modern signature: send(content=..., embeds=[...])
-    try:
-        await channel.send(content or None, embeds=embeds)
-        return
-    except TypeError:
-        # Old lib that doesn't accept embeds=
-        pass
+    await channel.send(content or None, embeds=embeds)
 
-    # Fallback: send header, then each embed as `embed=...`
-    if content:
-        await channel.send(content)
 
-    for e in embeds:
-        try:
-            await channel.send(embed=e)
-        except TypeError:
-            # Truly ancient or different fork; last resort: drop embed and send title/url
-            title = (getattr(e, "title", None) or "Item").strip()
-            url = (getattr(e, "url", None) or "").strip()
-            await channel.send(f"{title}\n{url}".strip())
-
-
-def _plain_wishlist_lines(on_sale: list[dict[str, Any]], *, limit: int = 10) -> list[str]:
-    lines: list[str] = []
-    for s in on_sale[:limit]:
-        name = (s.get("name") or "Game").strip()
-        url = (s.get("store_url") or "").strip()
-        disc = int(s.get("discount_percent") or 0)
-        final = s.get("final")
-        initial = s.get("initial")
-
-        if final and initial:
-            price = f"{final} (was {initial})"
-        elif final:
-            price = str(final)
-        else:
-            price = "See store"
-
-        if url:
-            lines.append(f"• **{name}** — {disc}% off — {price}\n  {url}")
-        else:
-            lines.append(f"• **{name}** — {disc}% off — {price}")
-
-    return lines
+def _chunk_reminder_messages(
+    items: list[tuple[int, int, str]],
+    *,
+    limit: int = 2000,
+) -> list[tuple[str, list[int]]]:
+    """
+    Pack (rid, app_id, name) reminder rows into message bodies under
+    Discord's char limit. Returns (body, rids) per message so the caller
+    can mark exactly the rows each send delivered.
+    """
+    chunks: list[tuple[str, list[int]]] = []
+    cur_lines: list[str] = []
+    cur_rids: list[int] = []
+    cur_len = 0
+
+    for (rid, app_id, name) in items:
+        line = f"**{name}** is coming out soon! https://store.steampowered.com/app/{app_id}"
+        added = len(line) + (1 if cur_lines else 0)  # +1 for the joining newline
+        if cur_lines and cur_len + added > limit:
+            chunks.append(("\n".join(cur_lines), cur_rids))
+            cur_lines, cur_rids, cur_len = [], [], 0
+            added = len(line)
+        cur_lines.append(line)
+        cur_rids.append(rid)
+        cur_len += added
+
+    if cur_lines:
+        chunks.append(("\n".join(cur_lines), cur_rids))
+    return chunks
+
+
+def _plain_wishlist_line(s: dict[str, Any]) -> str:
+    name = (s.get("name") or "Game").strip()
+    url = (s.get("store_url") or "").strip()
+    disc = int(s.get("discount_percent") or 0)
+    final = s.get("final")
+    initial = s.get("initial")
+
+    if final and initial:
+        price = f"{final} (was {initial})"
+    elif final:
+        price = str(final)
+    else:
+        price = "See store"
+
+    line = f"• **{name}** — {disc}% off — {price}"
+    return f"{line}\n  {url}" if url else line
+
+
+def _plain_wishlist_digest(on_sale: list[dict[str, Any]], *, limit: int = 10) -> str:
+    """One join over a generator instead of building an intermediate list."""
+    return "\n".join(_plain_wishlist_line(s) for s in on_sale[:limit])
+
+
+# Steam responses shared across guilds within a tick burst: guilds in
+# the same timezone refresh at the same local minute, and a game
+# wishlisted in several guilds would otherwise be fetched once per
+# guild. 10 minutes comfortably covers one burst without letting a
+# day-old price leak into the next.
+_STEAM_CACHE_TTL_S = 600.0
+_STEAM_SNAP_CACHE: dict[int, tuple[float, Any]] = {}
+_STEAM_DETAILS_CACHE: dict[int, tuple[float, Any]] = {}
+
+
+def _steam_cache_get(cache: dict[int, tuple[float, Any]], app_id: int):
+    """Returns the (ts, value) entry if fresh, else None. The tuple keeps
+    a cached None result distinguishable from a miss."""
+    hit = cache.get(app_id)
+    if hit is not None and time.monotonic() - hit[0] < _STEAM_CACHE_TTL_S:
+        return hit
+    return None
+
+
+async def _cached_app_details(steam: SteamClient, app_id: int):
+    hit = _steam_cache_get(_STEAM_DETAILS_CACHE, app_id)
+    if hit is not None:
+        return hit[1]
+    details = await steam.get_app_details(app_id)
+    _STEAM_DETAILS_CACHE[app_id] = (time.monotonic(), details)
+    return details
+
+
+async def _cached_price_snapshot(steam: SteamClient, app_id: int):
+    hit = _steam_cache_get(_STEAM_SNAP_CACHE, app_id)
+    if hit is not None:
+        return hit[1]
+    snap = await steam.get_price_snapshot(app_id)
+    _STEAM_SNAP_CACHE[app_id] = (time.monotonic(), snap)
+    return snap
+
+
+def _steam_for(client: Client, http) -> SteamClient:
+    """
+    One SteamClient per process, cached on the Discord client; rebuilding
+    it per guild per job re-read STEAM_KEY from the environment each
+    time. Rebuilt only if the shared http session was replaced.
+    """
+    steam = getattr(client, "_steam_client", None)
+    if steam is None or steam.http is not http:
+        steam = SteamClient.from_env(session=http)
+        client._steam_client = steam  # type: ignore[attr-defined]
+    return steam
 
 
 # -------------------------
@@ -176,8 +314,11 @@ async def _run_refresh_for_guild(client: Client, guild_id: int, tz_name: str, lo
         log.exception("[refresh] ensure_http_session failed guild=%s", guild_id)
         return
 
-    steam = SteamClient.from_env(session=http)
+    steam = _steam_for(client, http)
 
+    # DB work rides the guild's dedicated DB thread via run_db so SQLite
+    # fsyncs never stall the event loop (same pattern as the command
+    # handlers in app.py).
     try:
         conn = connect_guild_db(guild_id)
     except Exception:
@@ -185,20 +326,36 @@ async def _run_refresh_for_guild(client: Client, guild_id: int, tz_name: str, lo
         return
 
     try:
-        rows = list_unsent_for_refresh(conn)  # [(app_id, old_release_date_text), ...]
+        rows = await run_db(guild_id, list_unsent_for_refresh, conn)  # [(app_id, old_release_date_text), ...]
         if not rows:
-            set_setting(conn, "last_run_refresh_ymd", local_ymd)
+            await run_db(guild_id, set_setting, conn, "last_run_refresh_ymd", local_ymd)
             return
 
-        updated = 0
         checked = 0
+        # (app_id, release_at_utc, release_date_text, release_precision)
+        # collected across the loop and flushed in one bulk UPDATE below.
+        pending_updates: list[tuple[int, str, str | None, str]] = []
+
+        # Fetch Steam details concurrently (bounded — same pattern as the
+        # wishlist command) instead of one serial round-trip per app.
+        sem = asyncio.Semaphore(5)
+
+        async def _fetch_details(app_id: int):
+            async with sem:
+                return await _cached_app_details(steam, int(app_id))
 
-        for (app_id, old_text) in rows:
+        details_list = await asyncio.gather(
+            *(_fetch_details(int(app_id)) for (app_id, _old_text) in rows),
+            return_exceptions=True,
+        )
+
+        for (app_id, old_text), details in zip(rows, details_list):
             checked += 1
-            try:
-                details = await steam.get_app_details(int(app_id))
-            except Exception:
-                log.exception("[refresh] steam details failed app_id=%s guild=%s", app_id, guild_id)
+            if isinstance(details, BaseException):
+                log.error(
+                    "[refresh] steam details failed app_id=%s guild=%s",
+                    app_id, guild_id, exc_info=details,
+                )
                 continue
 
             if not details:
@@ -220,19 +377,17 @@ async def _run_refresh_for_guild(client: Client, guild_id: int, tz_name: str, lo
             old_norm = (old_text or "").strip()
             new_norm = (new_text or "").strip()
             if old_norm != new_norm:
-                try:
-                    update_release_fields(
-                        conn,
-                        app_id=int(app_id),
-                        release_at_utc=iso,
-                        release_date_text=new_text,
-                        release_precision=precision,
-                    )
-                    updated += 1
-                except Exception:
-                    log.exception("[refresh] db update failed app_id=%s guild=%s", app_id, guild_id)
+                pending_updates.append((int(app_id), iso, new_text, precision))
+
+        updated = len(pending_updates)
+        if pending_updates:
+            try:
+                await run_db(guild_id, update_release_fields_bulk, conn, pending_updates)
+            except Exception:
+                updated = 0
+                log.exception("[refresh] bulk db update failed guild=%s", guild_id)
 
-        set_setting(conn, "last_run_refresh_ymd", local_ymd)
+        await run_db(guild_id, set_setting, conn, "last_run_refresh_ymd", local_ymd)
         log.info(
             "[refresh] guild=%s tz=%s ymd=%s checked=%s updated=%s",
             guild_id, tz_name, local_ymd, checked, updated
@@ -249,7 +404,7 @@ async def _run_reminders_for_guild(client: Client, guild_id: int, tz_name: str,
     try:
         conn = connect_guild_db(guild_id)
         try:
-            purged = purge_expired_reminders(conn)
+            purged = await run_db(guild_id, purge_expired_reminders, conn)
             if purged:
                 log.info("[reminders] purged %d expired reminder(s) guild=%s", purged, guild_id)
         finally:
@@ -258,11 +413,11 @@ async def _run_reminders_for_guild(client: Client, guild_id: int, tz_name: str,
         log.exception("[reminders] purge failed guild=%s", guild_id)
 
     # 2) Send tomorrow reminders (timezone-aware)
-    rows = check_and_collect_tomorrow_reminders(guild_id, tz_name=tz_name)
+    rows = await run_db(guild_id, check_and_collect_tomorrow_reminders, guild_id, tz_name=tz_name)
     if not rows:
         conn = connect_guild_db(guild_id)
         try:
-            set_setting(conn, "last_run_reminders_ymd", local_ymd)
+            await run_db(guild_id, set_setting, conn, "last_run_reminders_ymd", local_ymd)
         finally:
             conn.close()
         return
@@ -272,6 +427,10 @@ async def _run_reminders_for_guild(client: Client, guild_id: int, tz_name: str,
 
     conn = connect_guild_db(guild_id)
     try:
+        # Resolve each row's target channel, then coalesce to one message
+        # per channel (chunked under Discord's 2000-char cap) instead of
+        # one HTTP POST per reminder.
+        by_channel: dict[int, list[tuple[int, int, str]]] = {}
         for (rid, app_id, name, _release_at_utc, remind_channel_id) in rows:
             # Target order:
             # 1) reminder row’s remind_channel_id if set (and >0)
@@ -280,7 +439,7 @@ async def _run_reminders_for_guild(client: Client, guild_id: int, tz_name: str,
             target_channel_id: int | None = None
 
             if TESTING_MODE:
-                target_channel_id = int(TEST_CHANNEL_ID)
+                target_channel_id = _TEST_CHANNEL_ID_INT
             else:
                 try:
                     if remind_channel_id is not None and int(remind_channel_id) > 0:
@@ -295,25 +454,36 @@ async def _run_reminders_for_guild(client: Client, guild_id: int, tz_name: str,
                 log.warning("[reminders] no channel configured rid=%s guild=%s (run *setchannel)", rid, guild_id)
                 continue
 
-            channel = client.get_channel(int(target_channel_id))
+            by_channel.setdefault(int(target_channel_id), []).append((int(rid), int(app_id), str(name)))
+
+        sent_ids: list[int] = []
+        for target_channel_id, items in by_channel.items():
+            channel = client.get_channel(target_channel_id)
             if not channel:
                 log.warning("[reminders] channel %s not found guild=%s", target_channel_id, guild_id)
                 continue
 
-            msg = f"**{name}** is coming out soon! https://store.steampowered.com/app/{app_id}"
+            for body, chunk_rids in _chunk_reminder_messages(items):
+                try:
+                    await _limiter_for(target_channel_id).acquire()
+                    await channel.send(body)
+                except Exception:
+                    log.exception(
+                        "[reminders] send failed rids=%s guild=%s channel=%s",
+                        chunk_rids, guild_id, target_channel_id,
+                    )
+                    continue
 
-            try:
-                await channel.send(msg)
-            except Exception:
-                log.exception("[reminders] send failed rid=%s guild=%s channel=%s", rid, guild_id, target_channel_id)
-                continue
+                sent_ids.extend(chunk_rids)
 
-            try:
-                mark_sent(conn, rid)
-            except Exception:
-                log.exception("[reminders] mark_sent failed rid=%s guild=%s", rid, guild_id)
+        # One UPDATE (and one fsync) for everything that went out, instead
+        # of a commit per reminder.
+        try:
+            await run_db(guild_id, mark_sent_bulk, conn, sent_ids)
+        except Exception:
+            log.exception("[reminders] mark_sent_bulk failed ids=%s guild=%s", sent_ids, guild_id)
 
-        set_setting(conn, "last_run_reminders_ymd", local_ymd)
+        await run_db(guild_id, set_setting, conn, "last_run_reminders_ymd", local_ymd)
         log.info(
             "[reminders] processed %d reminder(s) guild=%s tz=%s ymd=%s",
             len(rows), guild_id, tz_name, local_ymd
@@ -331,13 +501,13 @@ async def _run_wishlist_for_guild(client: Client, guild_id: int, tz_name: str, l
         log.exception("[wishlist] ensure_http_session failed guild=%s", guild_id)
         return
 
-    steam = SteamClient.from_env(session=http)
+    steam = _steam_for(client, http)
 
     # Load wishlist rows
     try:
         conn = connect_guild_db(guild_id)
         try:
-            rows = list_wishlist(conn)  # [(channel_id, app_id, name), ...]
+            rows = await run_db(guild_id, list_wishlist, conn)  # [(channel_id, app_id, name), ...]
         finally:
             conn.close()
     except Exception:
@@ -347,7 +517,7 @@ async def _run_wishlist_for_guild(client: Client, guild_id: int, tz_name: str, l
     if not rows:
         conn = connect_guild_db(guild_id)
         try:
-            set_setting(conn, "last_run_wishlist_ymd", local_ymd)
+            await run_db(guild_id, set_setting, conn, "last_run_wishlist_ymd", local_ymd)
         finally:
             conn.close()
         return
@@ -360,16 +530,29 @@ async def _run_wishlist_for_guild(client: Client, guild_id: int, tz_name: str, l
     guild = client.get_guild(guild_id)
 
     for channel_id, items in by_channel.items():
-        if TESTING_MODE and int(channel_id) != int(TEST_CHANNEL_ID):
+        if TESTING_MODE and int(channel_id) != _TEST_CHANNEL_ID_INT:
             continue
 
         on_sale: list[dict[str, Any]] = []
 
-        for app_id, _name in items:
-            try:
-                snap = await steam.get_price_snapshot(app_id)
-            except Exception:
-                log.exception("[wishlist] price fetch failed app_id=%s guild=%s", app_id, guild_id)
+        # Bounded-concurrency price fetches, like the wishlist command.
+        sem = asyncio.Semaphore(5)
+
+        async def _fetch_snap(app_id: int):
+            async with sem:
+                return await _cached_price_snapshot(steam, app_id)
+
+        snaps = await asyncio.gather(
+            *(_fetch_snap(app_id) for (app_id, _name) in items),
+            return_exceptions=True,
+        )
+
+        for (app_id, _name), snap in zip(items, snaps):
+            if isinstance(snap, BaseException):
+                log.error(
+                    "[wishlist] price fetch failed app_id=%s guild=%s",
+                    app_id, guild_id, exc_info=snap,
+                )
                 continue
 
             if not snap:
@@ -390,15 +573,20 @@ async def _run_wishlist_for_guild(client: Client, guild_id: int, tz_name: str, l
             continue
 
         # If the bot cannot embed links in this channel, send a plain-text digest instead.
+        # Deliberately not cached: the wishlist job is daily-gated, so this
+        # permissions_for walk already runs at most once per channel per
+        # day, and a process-lifetime cache would serve stale bits after a
+        # role or overwrite change until restart.
         try:
             if guild is not None and hasattr(channel, "permissions_for"):
                 me = getattr(guild, "me", None)
                 if me is not None:
                     perms = channel.permissions_for(me)  # type: ignore[attr-defined]
                     if not getattr(perms, "embed_links", True):
-                        lines = _plain_wishlist_lines(on_sale, limit=10)
+                        body = _plain_wishlist_digest(on_sale, limit=10)
                         header = "🛒 **Channel wishlist sales today:**\n(Enable the bot's **Embed Links** permission to see rich cards.)"
-                        await channel.send(header + ("\n" + "\n".join(lines) if lines else ""))
+                        await _limiter_for(channel_id).acquire()
+                        await channel.send(header + (f"\n{body}" if body else ""))
                         log.info("[wishlist] sent plaintext digest (no embed perm) guild=%s channel=%s", guild_id, channel_id)
                         continue
         except Exception:
@@ -430,8 +618,8 @@ async def _run_wishlist_for_guild(client: Client, guild_id: int, tz_name: str, l
             embeds.append(e)
 
         try:
-            # This is the key change: always send embeds in a compatibility-safe way.
-            await _send_embeds_compat(channel, content="🛒 **Channel wishlist sales today:**", embeds=embeds)
+            await _limiter_for(channel_id).acquire()
+            await _send_embeds(channel, content="🛒 **Channel wishlist sales today:**", embeds=embeds)
             log.info("[wishlist] sent sale digest guild=%s channel=%s count=%s", guild_id, channel_id, len(on_sale))
         except discord.Forbidden:
             log.warning(
@@ -443,7 +631,7 @@ async def _run_wishlist_for_guild(client: Client, guild_id: int, tz_name: str, l
 
     conn = connect_guild_db(guild_id)
     try:
-        set_setting(conn, "last_run_wishlist_ymd", local_ymd)
+        await run_db(guild_id, set_setting, conn, "last_run_wishlist_ymd", local_ymd)
     finally:
         conn.close()
 
@@ -452,61 +640,67 @@ async def _run_wishlist_for_guild(client: Client, guild_id: int, tz_name: str, l
 # Master tick (per-guild local times)
 # -------------------------
 
-@tasks.loop(seconds=30)
-async def master_tick(client: Client) -> None:
-    for g in client.guilds:
-        guild_id = g.id
-        if TESTING_MODE and int(guild_id) != int(TEST_GUILD_ID):
-            continue
+# Caps how many guilds run their scheduled jobs at once; the jobs inside
+# a guild still run in order.
+_GUILD_TICK_SEM = asyncio.Semaphore(8)
+
 
+async def _handle_guild_tick(client: Client, guild_id: int) -> None:
+    """
+    Resolve the guild's timezone and run whichever daily windows are open.
+    One guild's slow Steam calls no longer delay every other guild —
+    master_tick gathers these concurrently.
+    """
+    async with _GUILD_TICK_SEM:
         tz_name = _get_guild_timezone(guild_id)
         if not tz_name:
             # Not configured yet -> do nothing scheduled for this guild.
-            continue
+            return
 
-        try:
-            tz = ZoneInfo(tz_name)
-        except Exception:
+        tz = _tz(tz_name)
+        if tz is None:
             log.warning("[scheduler] invalid timezone guild=%s tz=%r (run *settimezone)", guild_id, tz_name)
-            continue
+            return
 
-        now_local = datetime.now(tz).replace(microsecond=0)
+        now_local = datetime.now(tz)
         local_ymd = now_local.date().isoformat()
+        sec_of_day = now_local.hour * 3600 + now_local.minute * 60 + now_local.second
 
         # Refresh at 17:55 local
-        if _in_local_window(now_local, hour=17, minute=55, window_seconds=120):
-            conn = connect_guild_db(guild_id)
-            try:
-                if not _should_run_today(conn, key="last_run_refresh_ymd", local_ymd=local_ymd):
-                    continue
-            finally:
-                conn.close()
-
+        if _in_local_window(sec_of_day, _REFRESH_SEC) and _should_run_today(
+            guild_id, key="last_run_refresh_ymd", local_ymd=local_ymd
+        ):
             await _run_refresh_for_guild(client, guild_id, tz_name, local_ymd)
 
         # Reminders at 18:00 local
-        if _in_local_window(now_local, hour=18, minute=0, window_seconds=120):
-            conn = connect_guild_db(guild_id)
-            try:
-                if not _should_run_today(conn, key="last_run_reminders_ymd", local_ymd=local_ymd):
-                    continue
-            finally:
-                conn.close()
-
+        if _in_local_window(sec_of_day, _REMINDERS_SEC) and _should_run_today(
+            guild_id, key="last_run_reminders_ymd", local_ymd=local_ymd
+        ):
             await _run_reminders_for_guild(client, guild_id, tz_name, local_ymd)
 
         # Wishlist at 18:03 local
-        if _in_local_window(now_local, hour=18, minute=3, window_seconds=120):
-            conn = connect_guild_db(guild_id)
-            try:
-                if not _should_run_today(conn, key="last_run_wishlist_ymd", local_ymd=local_ymd):
-                    continue
-            finally:
-                conn.close()
-
+        if _in_local_window(sec_of_day, _WISHLIST_SEC) and _should_run_today(
+            guild_id, key="last_run_wishlist_ymd", local_ymd=local_ymd
+        ):
             await _run_wishlist_for_guild(client, guild_id, tz_name, local_ymd)
 
 
+@tasks.loop(seconds=30)
+async def master_tick(client: Client) -> None:
+    test_gid = _TEST_GUILD_ID_INT if TESTING_MODE else None
+    guild_ids = [g.id for g in client.guilds if test_gid is None or int(g.id) == test_gid]
+    if not guild_ids:
+        return
+
+    results = await asyncio.gather(
+        *(_handle_guild_tick(client, gid) for gid in guild_ids),
+        return_exceptions=True,
+    )
+    for gid, res in zip(guild_ids, results):
+        if isinstance(res, BaseException):
+            log.error("[scheduler] tick failed guild=%s", gid, exc_info=res)
+
+
 @master_tick.before_loop
 async def before_master_tick() -> None:
     log.info("[scheduler] master tick starting")
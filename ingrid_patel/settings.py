@@ -51,10 +51,14 @@ RESTRICT_SEARCH_BUTTONS_TO_AUTHOR = False
 USER_ERROR_MESSAGE = "An error occured and the bot admin was notified. There should be a fix shortly."
 
 
+# Built once: owner_ids() is called on every dispatch, so don't rebuild the set.
+_OWNER_IDS = frozenset(BOT_OWNER_ID)
+
+
 def is_owner(user_id: int) -> bool:
-    return user_id in BOT_OWNER_ID
+    return user_id in _OWNER_IDS
 
 
-def owner_ids() -> set[int]:
+def owner_ids() -> frozenset[int]:
     # convenience if you ever expand to multiple owners
-    return set(BOT_OWNER_ID)
+    return _OWNER_IDS
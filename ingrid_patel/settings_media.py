@@ -2,10 +2,15 @@
 from __future__ import annotations
 
 import os
+import re
 
 DEFAULT_RADARR_ROOT = r"/media/Movies"
 DEFAULT_SONARR_ROOT = r"/media/Shows"
 
+# Collapses any run of 2+ backslashes to one in a single scan, replacing the
+# old replace()-in-a-loop approach that rescanned the string each pass.
+_RE_BACKSLASH_RUNS = re.compile(r"\\{2,}")
+
 
 def _normalize_root_folder(raw: str | None, default: str) -> str:
     """
@@ -26,16 +31,11 @@ def _normalize_root_folder(raw: str | None, default: str) -> str:
     if s.startswith("\\"):
         lead = len(s) - len(s.lstrip("\\"))
         if lead >= 2:
-            rest = s.lstrip("\\")
-            while "\\\\" in rest:
-                rest = rest.replace("\\\\", "\\")
-            return "\\\\" + rest
+            return "\\\\" + _RE_BACKSLASH_RUNS.sub("\\\\", s.lstrip("\\"))
         if lead == 1 and ":" not in s:
             return "\\" + s
 
-    while "\\\\" in s:
-        s = s.replace("\\\\", "\\")
-    return s
+    return _RE_BACKSLASH_RUNS.sub("\\\\", s)
 
 
 def get_radarr_config() -> tuple[str, str, str] | None:
@@ -0,0 +1,18 @@
+# ingrid_patel/utils/steam_urls.py
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+STEAM_STORE_BASE = "https://store.steampowered.com/app"
+STEAM_CDN_BASE = "https://cdn.cloudflare.steamstatic.com/steam/apps"
+
+
+@lru_cache(maxsize=4096)
+def store_url(app_id: int) -> str:
+    return f"{STEAM_STORE_BASE}/{app_id}"
+
+
+@lru_cache(maxsize=4096)
+def header_image_url(app_id: int) -> str:
+    return f"{STEAM_CDN_BASE}/{app_id}/header.jpg"
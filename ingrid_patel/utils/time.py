@@ -3,14 +3,28 @@
 from __future__ import annotations
 
 import re
+import time
 import unicodedata
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
 from typing import Optional
 
+# Timestamps are stored at second precision, so within one second every
+# utc_now_iso() call would format the identical string. Cache it; repo
+# code calls this on every insert/update and bulk paths call it in loops.
+# (A race just recomputes the same value, so no lock is needed.)
+_NOW_ISO_CACHE: tuple[int, str] = (0, "")
+
 
 def utc_now_iso() -> str:
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+    global _NOW_ISO_CACHE
+    s = int(time.time())
+    cached_s, cached_iso = _NOW_ISO_CACHE
+    if s == cached_s:
+        return cached_iso
+    iso = datetime.fromtimestamp(s, timezone.utc).isoformat()
+    _NOW_ISO_CACHE = (s, iso)
+    return iso
 
 
 def utc_now() -> datetime:
@@ -68,6 +82,27 @@ def format_release_mt(dt_utc_iso: str) -> str:
         return dt_utc_iso
 
 
+# Compiled once at import: the refresh job runs parse_steam_release_date
+# over every unsent reminder per guild per day, so skip the per-call
+# re-module cache lookups.
+_RE_WS = re.compile(r"\s+")
+_RE_UNKNOWN = re.compile(r"\b(tba|tbd|to be announced|coming soon)\b", re.IGNORECASE)
+_RE_LOCALIZED_DMY = re.compile(r"(\d{1,2})\s*/\s*([^/\s]+)\s*/\s*(\d{4})", re.IGNORECASE)
+_RE_MONTH_TOKEN_JUNK = re.compile(r"[^a-z0-9]")
+_RE_QUARTER = re.compile(r"Q([1-4])\s+(\d{4})", re.IGNORECASE)
+
+# Earliest plausible month starts (Northern hemisphere convention);
+# winter spans the year boundary, so anchor to Dec 1 of the stated year.
+_SEASON_START_MONTH: dict[str, int] = {
+    "spring": 3,
+    "summer": 6,
+    "fall": 9,
+    "autumn": 9,
+    "winter": 12,
+}
+
+_YEAR_PART_WORDS = ("early", "mid", "late")
+
 _PRECISION_UNKNOWN = "unknown"
 _PRECISION_DAY = "day"
 _PRECISION_MONTH = "month"
@@ -165,7 +200,7 @@ def _normalize_month_token(token: str) -> str:
     t = unicodedata.normalize("NFKD", token or "")
     t = "".join(ch for ch in t if not unicodedata.combining(ch))
     t = t.lower().strip().strip(".")
-    t = re.sub(r"[^a-z0-9]", "", t)
+    t = _RE_MONTH_TOKEN_JUNK.sub("", t)
     return t
 
 
@@ -176,7 +211,7 @@ def _parse_localized_dmy(date_text: str) -> str | None:
       - 26/feb/2026
       - 26/02/2026
     """
-    m = re.fullmatch(r"(\d{1,2})\s*/\s*([^/\s]+)\s*/\s*(\d{4})", (date_text or "").strip(), re.IGNORECASE)
+    m = _RE_LOCALIZED_DMY.fullmatch((date_text or "").strip())
     if not m:
         return None
 
@@ -216,46 +251,83 @@ def parse_steam_release_date(date_text: str) -> tuple[str | None, str]:
     if not s:
         return None, _PRECISION_UNKNOWN
 
-    s_norm = re.sub(r"\s+", " ", s).strip()
+    s_norm = _RE_WS.sub(" ", s).strip()
 
     # Common unknowns
-    if re.search(r"\b(tba|tbd|to be announced|coming soon)\b", s_norm, re.IGNORECASE):
+    if _RE_UNKNOWN.search(s_norm):
         return None, _PRECISION_UNKNOWN
 
-    # 1) Exact day formats (try multiple common Steam strings)
-    day_formats = (
-        "%b %d, %Y",      # Jan 20, 2026
-        "%B %d, %Y",      # January 20, 2026
-        "%d %b, %Y",      # 20 Jan, 2026 (rare)
-        "%d %B, %Y",      # 20 January, 2026 (rare)
-    )
-    for fmt in day_formats:
+    # Cheap dispatch before the strptime attempts below: every failed
+    # strptime raises and catches a ValueError, which dominates the cost
+    # for inputs like "2026" or "Q2 2026" that can never match the day
+    # formats. Gate each branch on a property the format requires.
+
+    # Year only (e.g. "2026") — no comma/slash/letters to check further.
+    if len(s_norm) == 4 and s_norm.isdigit():
+        year = int(s_norm)
         try:
-            # Anchor at UTC midnight for the date (no local timezone assumptions).
-            dt = datetime.strptime(s_norm, fmt).replace(tzinfo=timezone.utc)
-            dt = dt.replace(hour=0, minute=0, second=0, microsecond=0)
-            return dt.isoformat(), _PRECISION_DAY
+            dt = datetime(year, 1, 1, tzinfo=timezone.utc)
+            return dt.replace(hour=0, minute=0, second=0, microsecond=0).isoformat(), _PRECISION_YEAR
         except ValueError:
-            pass
-
-    localized_iso = _parse_localized_dmy(s_norm)
-    if localized_iso:
-        return localized_iso, _PRECISION_DAY
+            return None, _PRECISION_UNKNOWN
 
-    # 2) Month + year (e.g. "May 2026", "Sep 2026") -> anchor at first day UTC
-    m = re.fullmatch(r"([A-Za-z]+)\s+(\d{4})", s_norm)
-    if m:
-        mon_str, year_str = m.group(1), m.group(2)
-        for fmt in ("%b %Y", "%B %Y"):
+    # Deterministic month-name parse before any strptime: split the
+    # string and look the month up in _MONTH_ALIASES. The common Steam
+    # shapes ("Jan 20, 2026", "20 Jan, 2026", "May 2026") resolve here
+    # with plain int()/dict work — a failed strptime costs a raised and
+    # caught ValueError per format, which dominated this function.
+    parts = s_norm.replace(",", " ").split()
+    if len(parts) == 3 and parts[2].isdigit() and len(parts[2]) == 4:
+        year = int(parts[2])
+        month_num: int | None = None
+        day = 0
+        if parts[1].isdigit():      # Mon DD YYYY
+            month_num = _MONTH_ALIASES.get(_normalize_month_token(parts[0]))
+            day = int(parts[1])
+        elif parts[0].isdigit():    # DD Mon YYYY
+            month_num = _MONTH_ALIASES.get(_normalize_month_token(parts[1]))
+            day = int(parts[0])
+        if month_num and day:
             try:
-                dt = datetime.strptime(f"{mon_str} {year_str}", fmt).replace(tzinfo=timezone.utc)
-                dt = dt.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-                return dt.isoformat(), _PRECISION_MONTH
+                dt = datetime(year, month_num, day, tzinfo=timezone.utc)
+                return dt.isoformat(), _PRECISION_DAY
             except ValueError:
                 pass
+    elif len(parts) == 2 and parts[1].isdigit() and len(parts[1]) == 4:
+        month_num = _MONTH_ALIASES.get(_normalize_month_token(parts[0]))
+        if month_num:
+            dt = datetime(int(parts[1]), month_num, 1, tzinfo=timezone.utc)
+            return dt.isoformat(), _PRECISION_MONTH
+
+    # 1) Exact day formats (strptime fallback for unusual spellings) —
+    # all of them contain a comma, so skip the loop entirely otherwise.
+    if "," in s_norm:
+        day_formats = (
+            "%b %d, %Y",      # Jan 20, 2026
+            "%B %d, %Y",      # January 20, 2026
+            "%d %b, %Y",      # 20 Jan, 2026 (rare)
+            "%d %B, %Y",      # 20 January, 2026 (rare)
+        )
+        for fmt in day_formats:
+            try:
+                # Anchor at UTC midnight for the date (no local timezone assumptions).
+                dt = datetime.strptime(s_norm, fmt).replace(tzinfo=timezone.utc)
+                dt = dt.replace(hour=0, minute=0, second=0, microsecond=0)
+                return dt.isoformat(), _PRECISION_DAY
+            except ValueError:
+                pass
+
+    if "/" in s_norm:
+        localized_iso = _parse_localized_dmy(s_norm)
+        if localized_iso:
+            return localized_iso, _PRECISION_DAY
+
+    # (Month + year, e.g. "May 2026", is fully handled by the alias-table
+    # parse above — every name %b/%B knows is in _MONTH_ALIASES, so a
+    # strptime fallback here could only ever fail.)
 
     # 3) Quarter (Q1..Q4)
-    m = re.fullmatch(r"Q([1-4])\s+(\d{4})", s_norm, flags=re.IGNORECASE)
+    m = _RE_QUARTER.fullmatch(s_norm)
     if m:
         q = int(m.group(1))
         year = int(m.group(2))
@@ -263,39 +335,22 @@ def parse_steam_release_date(date_text: str) -> tuple[str | None, str]:
         dt = datetime(year, month, 1, tzinfo=timezone.utc)
         return dt.replace(hour=0, minute=0, second=0, microsecond=0).isoformat(), _PRECISION_QUARTER
 
-    # 4) Seasons (Spring/Summer/Fall/Autumn/Winter)
-    m = re.fullmatch(r"(Spring|Summer|Fall|Autumn|Winter)\s+(\d{4})", s_norm, flags=re.IGNORECASE)
-    if m:
-        season = m.group(1).lower()
-        year = int(m.group(2))
-
-        # Earliest plausible month starts (Northern hemisphere convention)
-        season_start_month = {
-            "spring": 3,
-            "summer": 6,
-            "fall": 9,
-            "autumn": 9,
-            "winter": 12,  # winter spans year boundary; anchor to Dec 1 of stated year
-        }[season]
+    # 4/5) Seasons ("Spring 2026") and year parts ("Early 2026") are both
+    # one word plus a 4-digit year, so reuse the token split from above and
+    # resolve the word with a dict / tuple lookup instead of regex matching.
+    if len(parts) == 2 and parts[1].isdigit() and len(parts[1]) == 4:
+        word = parts[0].lower()
+        year = int(parts[1])
 
-        dt = datetime(year, season_start_month, 1, tzinfo=timezone.utc)
-        return dt.replace(hour=0, minute=0, second=0, microsecond=0).isoformat(), _PRECISION_SEASON
+        season_start_month = _SEASON_START_MONTH.get(word)
+        if season_start_month:
+            dt = datetime(year, season_start_month, 1, tzinfo=timezone.utc)
+            return dt.replace(hour=0, minute=0, second=0, microsecond=0).isoformat(), _PRECISION_SEASON
 
-    # 5) Year only (e.g. "2026")
-    if s_norm.isdigit() and len(s_norm) == 4:
-        year = int(s_norm)
-        try:
+        # "Early 2026" / "Late 2026" -> year anchor (bare years returned above)
+        if word in _YEAR_PART_WORDS:
             dt = datetime(year, 1, 1, tzinfo=timezone.utc)
             return dt.replace(hour=0, minute=0, second=0, microsecond=0).isoformat(), _PRECISION_YEAR
-        except ValueError:
-            return None, _PRECISION_UNKNOWN
-
-    # "Early 2026" / "Late 2026" -> year anchor
-    m = re.fullmatch(r"(Early|Mid|Late)\s+(\d{4})", s_norm, flags=re.IGNORECASE)
-    if m:
-        year = int(m.group(2))
-        dt = datetime(year, 1, 1, tzinfo=timezone.utc)
-        return dt.replace(hour=0, minute=0, second=0, microsecond=0).isoformat(), _PRECISION_YEAR
 
     return None, _PRECISION_UNKNOWN
 